@@ -6,7 +6,6 @@ import logging
 import math
 import os
 import re
-from dataclasses import asdict
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
@@ -17,7 +16,7 @@ except ImportError:  # pragma: no cover - optional runtime dependency
     OpenAI = None  # type: ignore
 
 from .content_processor import ContentProcessor, DocumentChunk
-from .cache_manager import CacheManager
+from .cache_manager import CacheManager, SemanticAnswerCache
 from .deep_search import DeepSearchOrchestrator
 from .settings import Config
 from .site_identifier import SiteCandidate, SiteIdentifier
@@ -27,6 +26,11 @@ from .point_list.knowledge import KnowledgeGraph
 
 LOGGER = logging.getLogger(__name__)
 
+RAG_SYSTEM_PROMPT = (
+    "You are a documentation research assistant. Use the provided context to answer the user question. "
+    "Cite URLs inline. If code_context is provided, tailor the answer to it."
+)
+
 
 class AgenticRAGEngine:
     """Coordinates site discovery, scraping, chunking, retrieval, and reasoning."""
@@ -50,13 +54,20 @@ class AgenticRAGEngine:
         self.max_sites = 5
         self.max_chunks = 8
         self._llm_client = self._init_llm_client()
+        self._answer_cache = SemanticAnswerCache(config)
+        self._last_query_embedding: Optional[Tuple[str, np.ndarray]] = None
         
         # Initialize terminology system
         self._terminology_extractor = TerminologyExtractor(config)
         self._terminology_indexer = TerminologyIndexer(config)
-        self._term_selector = TermSelector(config)
+        self._term_selector = TermSelector(config, embed_query=self._embed_query)
         self._knowledge_graph = KnowledgeGraph(config)
 
+    async def close(self) -> None:
+        """Cancel pending term extraction and release the indexer's HTTP session."""
+        await self._terminology_extractor.close()
+        await self._terminology_indexer.close()
+
     def _init_llm_client(self):  # pragma: no cover - runtime integration
         api_key = os.getenv("OPENAI_API_KEY")
         if OpenAI is None or not api_key:
@@ -89,6 +100,15 @@ class AgenticRAGEngine:
         self.cache.set(cache_key, payload)
         return chunks, metadata
 
+    def _embed_query(self, query: str) -> np.ndarray:
+        """Embed a query, reusing the result for back-to-back calls."""
+        last = self._last_query_embedding
+        if last is not None and last[0] == query:
+            return last[1]
+        embedding = self.processor.model.encode([query], convert_to_numpy=True)[0]
+        self._last_query_embedding = (query, embedding)
+        return embedding
+
     async def _gather_sites(self, query: str, limit: Optional[int] = None) -> List[SiteCandidate]:
         limit = limit or self.max_sites
         candidates = await self.identifier.identify(query, limit=limit)
@@ -104,7 +124,7 @@ class AgenticRAGEngine:
         if not chunk_sets:
             return []
 
-        query_embedding = self.processor.model.encode([query], convert_to_numpy=True)[0]
+        query_embedding = self._embed_query(query)
         query_norm = np.linalg.norm(query_embedding) or 1.0
         normalized_query = query_embedding / query_norm
 
@@ -158,18 +178,28 @@ class AgenticRAGEngine:
                 summary_lines.append(f"  * {chunk['site']['url']}")
             return "\n".join(summary_lines)
 
-        prompt = (
-            "You are a documentation research assistant. Use the provided context to answer the user question. "
-            "Cite URLs inline. If code_context is provided, tailor the answer to it."
-        )
+        # Reuse an earlier answer for a near-identical question that was
+        # grounded in the same retrieved chunks
+        cache_namespace = self.cache.make_key("answer", code_context or "")
+        query_embedding = self._embed_query(query)
+        chunk_ids = [chunk["chunk_id"] for chunk in top_chunks]
+        cached_answer = self._answer_cache.get(cache_namespace, query_embedding, chunk_ids)
+        if cached_answer is not None:
+            LOGGER.debug("Semantic answer cache hit for %r", query)
+            return cached_answer
+
+        # Keep the fixed instructions and retrieved documentation as the
+        # message prefix and put per-request parts last, so repeated context
+        # hits the provider's prompt prefix cache instead of being re-prefilled.
+        question = f"Question: {query}"
         if code_context:
-            prompt += f"\n\nCode context:\n{code_context}"
+            question = f"Code context:\n{code_context}\n\n{question}"
 
         messages = [
-            {"role": "system", "content": prompt},
+            {"role": "system", "content": RAG_SYSTEM_PROMPT},
             {"role": "assistant", "content": "Here is the retrieved documentation context:"},
             {"role": "user", "content": formatted_context},
-            {"role": "user", "content": f"Question: {query}"},
+            {"role": "user", "content": question},
         ]
 
         try:
@@ -179,11 +209,14 @@ class AgenticRAGEngine:
                 max_tokens=self.config.ai.max_tokens,
                 messages=messages,
             )
-            return response.choices[0].message.content.strip()
+            answer = response.choices[0].message.content.strip()
         except Exception as exc:  # pragma: no cover - runtime call
             LOGGER.warning("LLM generation failed: %s", exc)
             return formatted_context[:1000]
 
+        self._answer_cache.set(cache_namespace, query_embedding, chunk_ids, answer)
+        return answer
+
     async def search(self, query: str, code_context: Optional[str] = None) -> Dict[str, Any]:
         candidates = await self._gather_sites(query)
         chunk_sets: List[Tuple[SiteCandidate, List[DocumentChunk]]] = []
@@ -198,7 +231,7 @@ class AgenticRAGEngine:
         return {
             "query": query,
             "answer": answer,
-            "sources": [asdict(candidate) for candidate in candidates],
+            "sources": [candidate.to_dict() for candidate in candidates],
             "top_chunks": top_chunks,
         }
 
@@ -3,13 +3,21 @@ from __future__ import annotations
 
 import hashlib
 import json
+import logging
+import sqlite3
 import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass
+from pathlib import Path
 from threading import RLock
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, FrozenSet, Iterable, List, Optional
+
+import numpy as np
 
 from .settings import Config
 
+LOGGER = logging.getLogger(__name__)
+
 
 @dataclass
 class CacheEntry:
@@ -59,3 +67,251 @@ class CacheManager:
             self._store[key] = CacheEntry(value=value, timestamp=time.time())
             self._evict_expired()
             self._evict_overflow()
+
+
+@dataclass
+class SemanticCacheEntry:
+    namespace: str
+    embedding: np.ndarray
+    chunk_ids: FrozenSet[str]
+    value: Any
+    timestamp: float
+
+
+class SemanticAnswerCache:
+    """TTL cache that reuses generated answers for near-duplicate queries.
+
+    An entry is only reused when the query embedding is close to the cached
+    one and the answer was grounded in mostly the same retrieved chunks. Chunk
+    IDs are regenerated whenever a site is re-scraped, so answers built from
+    outdated content stop matching on their own.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        *,
+        similarity_threshold: float = 0.92,
+        overlap_threshold: float = 0.7,
+    ) -> None:
+        self._ttl = config.cache.ttl
+        self._max_size = config.cache.max_size
+        self._similarity_threshold = similarity_threshold
+        self._overlap_threshold = overlap_threshold
+        self._entries: Deque[SemanticCacheEntry] = deque()
+        self._lock = RLock()
+
+    @staticmethod
+    def _normalize(embedding: Any) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector) or 1.0
+        return vector / norm
+
+    @staticmethod
+    def _jaccard(left: FrozenSet[str], right: FrozenSet[str]) -> float:
+        if not left and not right:
+            return 1.0
+        return len(left & right) / len(left | right)
+
+    def _evict_expired(self) -> None:
+        # Entries are appended in time order, so expired ones sit at the front
+        now = time.time()
+        while self._entries and now - self._entries[0].timestamp > self._ttl:
+            self._entries.popleft()
+
+    def get(
+        self,
+        namespace: str,
+        embedding: Any,
+        chunk_ids: Iterable[str],
+    ) -> Optional[Any]:
+        with self._lock:
+            self._evict_expired()
+            candidates = [
+                entry for entry in self._entries if entry.namespace == namespace
+            ]
+            if not candidates:
+                return None
+
+            query = self._normalize(embedding)
+            matrix = np.stack([entry.embedding for entry in candidates])
+            similarities = matrix @ query
+            retrieved = frozenset(chunk_ids)
+
+            for index in np.argsort(similarities)[::-1]:
+                if similarities[index] < self._similarity_threshold:
+                    break
+                entry = candidates[index]
+                if self._jaccard(entry.chunk_ids, retrieved) >= self._overlap_threshold:
+                    return entry.value
+            return None
+
+    def set(
+        self,
+        namespace: str,
+        embedding: Any,
+        chunk_ids: Iterable[str],
+        value: Any,
+    ) -> None:
+        with self._lock:
+            self._entries.append(
+                SemanticCacheEntry(
+                    namespace=namespace,
+                    embedding=self._normalize(embedding),
+                    chunk_ids=frozenset(chunk_ids),
+                    value=value,
+                    timestamp=time.time(),
+                )
+            )
+            self._evict_expired()
+            while len(self._entries) > self._max_size:
+                self._entries.popleft()
+
+
+class EmbeddingCache:
+    """Thread-safe LRU of embeddings keyed by a hash of the embedded text.
+
+    Re-scraped pages produce new chunk IDs but mostly identical chunk text,
+    so keying by content lets reloads skip the embedding model.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._store: OrderedDict[str, List[float]] = OrderedDict()
+        self._lock = RLock()
+
+    @staticmethod
+    def make_key(text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            embedding = self._store.get(key)
+            if embedding is None:
+                return None
+            self._store.move_to_end(key)
+            return list(embedding)
+
+    def set(self, key: str, embedding: List[float]) -> None:
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._store[key] = list(embedding)
+            self._store.move_to_end(key)
+            while len(self._store) > self._max_size:
+                self._store.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
+@dataclass
+class CachedResponse:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: str
+
+
+class HttpResponseCache:
+    """On-disk store of fetched pages and their ETag/Last-Modified validators.
+
+    Re-crawls send conditional requests with the stored validators and reuse
+    the stored body when the server answers 304 Not Modified. Rows not
+    stored or revalidated within ``max_age`` seconds are dropped, as are the
+    least recently used rows beyond ``max_entries``.
+    """
+
+    # Eviction runs on open and after this many stores, not on every store
+    PRUNE_INTERVAL = 100
+
+    def __init__(self, path: Path, *, max_entries: int, max_age: float) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_entries = max_entries
+        self._max_age = max_age
+        self._stores_since_prune = 0
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        # Only takes effect for a new database; lets pruning return free pages
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body TEXT NOT NULL, "
+            "updated_at REAL NOT NULL DEFAULT 0)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        if "updated_at" not in columns:
+            # Caches created before eviction existed; their rows count as expired
+            self._conn.execute(
+                "ALTER TABLE responses ADD COLUMN updated_at REAL NOT NULL DEFAULT 0"
+            )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_updated_at ON responses (updated_at)"
+        )
+        self._conn.commit()
+        self._lock = RLock()
+        self._prune()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT etag, last_modified, body FROM responses WHERE url = ?", (url,)
+                ).fetchone()
+        except sqlite3.Error as exc:
+            LOGGER.warning("HTTP cache lookup failed for %s: %s", url, exc)
+            return None
+        return CachedResponse(*row) if row else None
+
+    def set(self, url: str, etag: Optional[str], last_modified: Optional[str], body: str) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(url, etag, last_modified, body, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    (url, etag, last_modified, body, time.time()),
+                )
+                self._conn.commit()
+                self._stores_since_prune += 1
+                if self._stores_since_prune >= self.PRUNE_INTERVAL:
+                    self._prune()
+        except sqlite3.Error as exc:
+            LOGGER.warning("HTTP cache update failed for %s: %s", url, exc)
+
+    def touch(self, url: str) -> None:
+        """Mark a row as just revalidated so it is not evicted as unused."""
+        self._execute(url, "UPDATE responses SET updated_at = ? WHERE url = ?", (time.time(), url))
+
+    def delete(self, url: str) -> None:
+        """Forget a URL, e.g. once a fresh response carries no validators."""
+        self._execute(url, "DELETE FROM responses WHERE url = ?", (url,))
+
+    def _execute(self, url: str, sql: str, params: tuple) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(sql, params)
+                self._conn.commit()
+        except sqlite3.Error as exc:
+            LOGGER.warning("HTTP cache update failed for %s: %s", url, exc)
+
+    def _prune(self) -> None:
+        """Drop expired rows and the least recently used rows over the cap."""
+        try:
+            with self._lock:
+                self._stores_since_prune = 0
+                self._conn.execute(
+                    "DELETE FROM responses WHERE updated_at < ?",
+                    (time.time() - self._max_age,),
+                )
+                self._conn.execute(
+                    "DELETE FROM responses WHERE url IN ("
+                    "SELECT url FROM responses ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+                    (self._max_entries,),
+                )
+                self._conn.commit()
+                self._conn.execute("PRAGMA incremental_vacuum")
+        except sqlite3.Error as exc:
+            LOGGER.warning("HTTP cache eviction failed: %s", exc)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -9,6 +9,7 @@ from typing import Any, Dict, Iterable, List, Optional
 
 from sentence_transformers import SentenceTransformer
 
+from .cache_manager import EmbeddingCache
 from .settings import Config
 
 
@@ -45,6 +46,7 @@ class ContentProcessor:
         self.model = SentenceTransformer(config.rag.embedding_model)
         self.chunk_size = config.rag.chunk_size
         self.chunk_overlap = config.rag.chunk_overlap
+        self.embedding_cache = EmbeddingCache(config.rag.embedding_cache_size)
 
     def chunk_text(self, text: str, metadata: Optional[Dict[str, str]] = None) -> List[DocumentChunk]:
         metadata = metadata or {}
@@ -83,10 +85,25 @@ class ContentProcessor:
         chunk_list = list(chunks)
         if not chunk_list:
             return []
-        texts = [chunk.text for chunk in chunk_list]
+        # Only send chunks whose text has not been embedded before to the model
+        pending: List[DocumentChunk] = []
+        pending_keys: List[str] = []
+        for chunk in chunk_list:
+            key = self.embedding_cache.make_key(chunk.text)
+            cached = self.embedding_cache.get(key)
+            if cached is not None:
+                chunk.embedding = cached
+            else:
+                pending.append(chunk)
+                pending_keys.append(key)
+        if not pending:
+            return chunk_list
+
+        texts = [chunk.text for chunk in pending]
         embeddings = self.model.encode(texts, show_progress_bar=False, convert_to_numpy=False)
-        for chunk, embedding in zip(chunk_list, embeddings):
+        for chunk, key, embedding in zip(pending, pending_keys, embeddings):
             chunk.embedding = embedding.tolist() if hasattr(embedding, "tolist") else list(embedding)
+            self.embedding_cache.set(key, chunk.embedding)
         return chunk_list
 
     def process_document(self, text: str, metadata: Optional[Dict[str, str]] = None) -> List[DocumentChunk]:
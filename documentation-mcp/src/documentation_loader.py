@@ -10,7 +10,7 @@ import tempfile
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 try:
@@ -24,6 +24,39 @@ from .web_scraper import ScrapedPage, WebScraper
 
 LOGGER = logging.getLogger(__name__)
 
+# File type names and extensions (without the dot) -> parser kind.
+# Anything not listed is treated as plain text.
+_FILE_KINDS = {
+    "md": "markdown",
+    "markdown": "markdown",
+    "html": "html",
+    "htm": "html",
+    "txt": "text",
+    "text": "text",
+    "rst": "text",  # Basic RST handling - treat as text
+    "restructuredtext": "text",
+}
+
+# Parser kinds that are CPU-heavy enough to run in a worker process
+_HEAVY_FILE_KINDS = frozenset({"html"})
+
+
+def _parse_file_content(file_content: str, kind: str) -> Tuple[str, str, str]:
+    """Convert uploaded file content of a parser kind to ``(text, markdown, html)``.
+
+    Module-level so it can run in a worker process.
+    """
+    if kind == "html":
+        from bs4 import BeautifulSoup
+        from markdownify import markdownify
+
+        soup = BeautifulSoup(file_content, "lxml")
+        text = soup.get_text("\n")
+        markdown = markdownify(file_content, heading_style="ATX")
+        return text, markdown, file_content
+    # Markdown is readable as text; plain text doubles as markdown
+    return file_content, file_content, ""
+
 
 class LoadMethod(Enum):
     """How the documentation was loaded."""
@@ -264,6 +297,16 @@ class DocumentationLoader:
         self.scraper = scraper
         self.site_identifier = site_identifier
         self.finder = DocumentationFinder(config, site_identifier)
+
+    async def _parse_off_loop(
+        self, file_content: str, kind: str
+    ) -> Tuple[str, str, str]:
+        """Parse heavy file types in a worker process, falling back to a thread.
+
+        Uses the scraper's CPU worker pool, so uploads and scraped pages share
+        one set of worker processes.
+        """
+        return await self.scraper.run_in_worker(_parse_file_content, file_content, kind)
     
     async def load_from_file(
         self,
@@ -281,32 +324,11 @@ class DocumentationLoader:
             file_type = ext.lstrip(".")
         
         # Parse content based on file type
-        if file_type in ("md", "markdown"):
-            markdown = file_content
-            text = file_content  # Markdown is readable as text
-            html = ""
-        elif file_type in ("html", "htm"):
-            from bs4 import BeautifulSoup
-            from markdownify import markdownify
-            
-            soup = BeautifulSoup(file_content, "lxml")
-            text = soup.get_text("\n")
-            markdown = markdownify(file_content, heading_style="ATX")
-            html = file_content
-        elif file_type in ("txt", "text"):
-            text = file_content
-            markdown = file_content
-            html = ""
-        elif file_type in ("rst", "restructuredtext"):
-            # Basic RST handling - treat as text
-            text = file_content
-            markdown = file_content
-            html = ""
+        kind = _FILE_KINDS.get(file_type.lower(), "text")
+        if kind in _HEAVY_FILE_KINDS:
+            text, markdown, html = await self._parse_off_loop(file_content, kind)
         else:
-            # Default: treat as plain text
-            text = file_content
-            markdown = file_content
-            html = ""
+            text, markdown, html = _parse_file_content(file_content, kind)
         
         # Create a ScrapedPage from the file
         page = ScrapedPage(
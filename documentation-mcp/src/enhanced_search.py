@@ -39,18 +39,7 @@ class UnifiedSearchResult:
         """Serialize to dictionary."""
         return {
             "query": self.query,
-            "code_results": [
-                {
-                    "file_path": r.file_path,
-                    "language": r.language,
-                    "snippet": r.snippet,
-                    "line_number": r.line_number,
-                    "context": r.context,
-                    "score": r.score,
-                    "source_url": r.source_url,
-                }
-                for r in self.code_results
-            ],
+            "code_results": [r.to_dict() for r in self.code_results],
             "point_results": [
                 {
                     "id": p.id,
@@ -88,6 +77,10 @@ class EnhancedSearchEngine:
         self.point_list_builder = PointListBuilder(config)
         self.knowledge_graph = KnowledgeGraph(config)
         self.proactive_indexer = proactive_indexer
+        if proactive_indexer is not None:
+            # Drop cached code search results once new code files are written;
+            # the cache TTL covers the lag until Zoekt has re-indexed them
+            proactive_indexer.zoekt_indexer.add_index_listener(self.zoekt_engine.invalidate)
         self._llm_client = self._init_llm_client()
 
     def _init_llm_client(self):
@@ -31,7 +31,7 @@ class PointType(Enum):
     NOTE = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedPoint:
     """A single extracted point from documentation."""
 
@@ -50,6 +50,18 @@ class ExtractedPoint:
         name_slug = re.sub(r"[^a-z0-9]", "_", self.name.lower())[:20]
         return f"{type_prefix}_{name_slug}"
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dictionary (without related point links)."""
+        return {
+            "id": self.id,
+            "type": self.point_type.name,
+            "name": self.name,
+            "description": self.description,
+            "source_url": self.source_url,
+            "confidence": self.confidence,
+            "metadata": self.metadata,
+        }
+
 
 class ContentAnalyzer:
     """Analyzes documentation content to extract structured points.
@@ -89,16 +89,7 @@ class PointList:
             "source_title": self.source_title,
             "metadata": self.metadata,
             "points": [
-                {
-                    "id": p.id,
-                    "type": p.point_type.name,
-                    "name": p.name,
-                    "description": p.description,
-                    "source_url": p.source_url,
-                    "confidence": p.confidence,
-                    "metadata": p.metadata,
-                    "related_points": p.related_points,
-                }
+                {**p.to_dict(), "related_points": p.related_points}
                 for p in self.points
             ],
         }
@@ -154,6 +145,24 @@ class PointListBuilder:
             LOGGER.debug("Using cached point list for %s", page.url)
             return self._cache[cache_key]
 
+        point_list = self.build_uncached(page)
+
+        # Cache the result
+        self.cache_point_list(point_list)
+
+        LOGGER.info(
+            "Built point list for %s: %d points",
+            page.url,
+            len(point_list.points),
+        )
+
+        return point_list
+
+    def build_uncached(self, page: ScrapedPage) -> PointList:
+        """Build a point list without reading or updating the cache.
+
+        Only reads the config, so it can run in a worker process.
+        """
         # Extract points using analyzer
         points = self.analyzer.analyze(page)
 
@@ -172,17 +181,12 @@ class PointListBuilder:
         if self.config.point_list.build_relationships:
             self._link_related_points(point_list)
 
-        # Cache the result
-        self._cache[cache_key] = point_list
-
-        LOGGER.info(
-            "Built point list for %s: %d points",
-            page.url,
-            len(points),
-        )
-
         return point_list
 
+    def cache_point_list(self, point_list: PointList) -> None:
+        """Store a point list built elsewhere, replacing any cached one."""
+        self._cache[point_list.source_url] = point_list
+
     def build_many(self, pages: List[ScrapedPage]) -> List[PointList]:
         """Build point lists from multiple pages."""
         return [self.build(page) for page in pages]
@@ -100,13 +100,15 @@ class KnowledgeGraph:
     def add_relationship(self, relationship: Relationship) -> None:
         """Add a relationship between two points."""
         # Ensure both nodes exist
-        if relationship.source_id not in self._nodes:
+        source = self._nodes.get(relationship.source_id)
+        if source is None:
             LOGGER.warning(
                 "Source node %s not found for relationship",
                 relationship.source_id,
             )
             return
-        if relationship.target_id not in self._nodes:
+        target = self._nodes.get(relationship.target_id)
+        if target is None:
             LOGGER.warning(
                 "Target node %s not found for relationship",
                 relationship.target_id,
@@ -114,8 +116,8 @@ class KnowledgeGraph:
             return
 
         self._relationships.append(relationship)
-        self._nodes[relationship.source_id].outgoing.append(relationship)
-        self._nodes[relationship.target_id].incoming.append(relationship)
+        source.outgoing.append(relationship)
+        target.incoming.append(relationship)
 
     def get_node(self, point_id: str) -> Optional[GraphNode]:
         """Get a node by its point ID."""
@@ -322,7 +324,7 @@ class KnowledgeGraph:
                 confidence=term.confidence,
                 metadata={
                     **term.metadata,
-                    "term_type": term.term_type.name,
+                    "term_type": term.type_name,
                     "frequency": term.frequency,
                     "is_terminology": True,
                 },
@@ -335,14 +337,14 @@ class KnowledgeGraph:
             # Store in terminology-specific indices
             node = self._nodes[point.id]
             node.terminology_data = {
-                "term_type": term.term_type.name,
+                "term_type": term.type_name,
                 "frequency": term.frequency,
                 "context": term.context,
                 "original_term": term.term,
             }
             
             self._term_nodes[point.id] = node
-            self._term_index[term.term.lower()] = point.id
+            self._term_index[term.term_lower] = point.id
         
         # Create terminology relationships
         self._create_terminology_relationships(terms)
@@ -364,15 +366,15 @@ class KnowledgeGraph:
     
     def _infer_term_relationship(self, term1: ExtractedTerm, term2: ExtractedTerm) -> None:
         """Infer relationship between two terms based on their properties."""
-        id1 = self._term_index.get(term1.term.lower())
-        id2 = self._term_index.get(term2.term.lower())
+        id1 = self._term_index.get(term1.term_lower)
+        id2 = self._term_index.get(term2.term_lower)
         
         if not id1 or not id2:
             return
         
         # Hierarchical relationships
         if term1.term_type == TermType.CONCEPT and term2.term_type == TermType.TECHNICAL_TERM:
-            if term2.term.lower() in term1.context.lower():
+            if term2.term_lower in term1.context.lower():
                 self.add_relationship(Relationship(
                     source_id=id1,
                     target_id=id2,
@@ -381,7 +383,7 @@ class KnowledgeGraph:
                 ))
         
         elif term2.term_type == TermType.CONCEPT and term1.term_type == TermType.TECHNICAL_TERM:
-            if term1.term.lower() in term2.context.lower():
+            if term1.term_lower in term2.context.lower():
                 self.add_relationship(Relationship(
                     source_id=id2,
                     target_id=id1,
@@ -390,14 +392,14 @@ class KnowledgeGraph:
                 ))
         
         # Definition relationships
-        if term1.definition and term2.term.lower() in term1.definition.lower():
+        if term1.definition and term2.term_lower in term1.definition.lower():
             self.add_relationship(Relationship(
                 source_id=id1,
                 target_id=id2,
                 relation_type=RelationType.TERM_DEFINITION,
                 confidence=0.8,
             ))
-        elif term2.definition and term1.term.lower() in term2.definition.lower():
+        elif term2.definition and term1.term_lower in term2.definition.lower():
             self.add_relationship(Relationship(
                 source_id=id2,
                 target_id=id1,
@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
+import heapq
 import logging
+import os
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
 from ..settings import Config
 from ..site_identifier import SiteIdentifier
-from ..web_scraper import ScrapedPage, WebScraper
+from ..web_scraper import WORKER_MP_CONTEXT, ScrapedPage, WebScraper
 from ..zoekt.indexer import ZoektIndexer
 from ..point_list.builder import PointListBuilder, PointList
 from .scheduler import BackgroundScheduler, TaskStatus
@@ -18,6 +26,32 @@ from .scheduler import BackgroundScheduler, TaskStatus
 LOGGER = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _url_to_repo_name(url: str) -> str:
+    """Convert a URL to a repository name for Zoekt."""
+    parsed = urlparse(url)
+    hostname = parsed.hostname or "unknown"
+    path = parsed.path.strip("/").replace("/", "_")[:30]
+    return f"{hostname}_{path}" if path else hostname
+
+
+# Per-process builder used by the point list worker pool
+_WORKER_BUILDER: Optional[PointListBuilder] = None
+
+
+def _init_point_list_worker(config: Config) -> None:
+    """Create the point list builder once per worker process."""
+    global _WORKER_BUILDER
+    _WORKER_BUILDER = PointListBuilder(config)
+
+
+def _build_point_list_in_worker(page: ScrapedPage) -> PointList:
+    """Build a point list inside a worker process."""
+    if _WORKER_BUILDER is None:
+        raise RuntimeError("Point list worker was not initialized")
+    return _WORKER_BUILDER.build_uncached(page)
+
+
 @dataclass
 class IndexingTask:
     """Represents an indexing task for a URL."""
@@ -37,6 +71,10 @@ class ProactiveIndexer:
     - Maintains index freshness with periodic re-indexing
     - Combines Zoekt code indexing with point list extraction
     - Background processing with progress tracking
+
+    Scraping goes through the injected WebScraper, whose pooled keep-alive
+    session is shared with the rest of the server, so indexing tasks reuse
+    connections instead of opening new ones per URL.
     """
 
     def __init__(
@@ -56,11 +94,31 @@ class ProactiveIndexer:
         self.zoekt_indexer = ZoektIndexer(config)
         self.point_list_builder = PointListBuilder(config)
 
-        # Track indexed URLs
-        self._indexed_urls: Dict[str, float] = {}  # url -> timestamp
-        self._point_lists: Dict[str, PointList] = {}  # url -> point list
-        self._pending_urls: Set[str] = set()
+        # Track indexed URLs, oldest first; capped at max_tracked_urls
+        self._indexed_urls: OrderedDict[str, float] = OrderedDict()  # url -> wall-clock
+        # Monotonic index times; all age and staleness checks use these
+        self._indexed_mono: Dict[str, float] = {}
+        # Adaptive re-index interval: doubles while content is unchanged,
+        # halves when it changes, bounded by the min/max settings.
+        self._url_ttl: Dict[str, float] = {}  # url -> seconds
+        self._url_hash: Dict[str, str] = {}  # url -> content digest
+        # Min-heap of (due_at, indexed_at, url); entries superseded by a newer
+        # index of the same URL are skipped lazily when popped.
+        self._freshness_heap: List[Tuple[float, float, str]] = []
+        # url -> point list, least recently used first; capped at max_point_lists
+        self._point_lists: OrderedDict[str, PointList] = OrderedDict()
+        self._evicted_urls = 0
+        self._evicted_point_lists = 0
+        # url -> (task_id, marker) for indexing runs not yet finished;
+        # repeated requests for the same URL share one run. The marker tells
+        # a run's own entry apart from a newer one for the same URL.
+        self._inflight: Dict[str, Tuple[str, object]] = {}
         self._reindex_task: Optional[asyncio.Task[None]] = None
+        # Wakes the re-index loop immediately on stop()
+        self._stop_event = asyncio.Event()
+        # Point list extraction is CPU-bound, so it runs in worker processes
+        # while the indexer is started; a thread is used otherwise.
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
 
     @property
     def enabled(self) -> bool:
@@ -73,6 +131,19 @@ class ProactiveIndexer:
             return
 
         await self.scheduler.start()
+        self._stop_event.clear()
+
+        if self.config.point_list.enabled:
+            self._cpu_pool = ProcessPoolExecutor(
+                max_workers=min(
+                    os.cpu_count() or 1,
+                    self.settings.max_concurrent_indexing,
+                ),
+                initializer=_init_point_list_worker,
+                initargs=(self.config,),
+                # Not forked: the server process is multi-threaded by now
+                mp_context=WORKER_MP_CONTEXT,
+            )
 
         # Start periodic re-indexing if configured
         if self.settings.reindex_interval > 0:
@@ -82,22 +153,38 @@ class ProactiveIndexer:
 
     async def stop(self) -> None:
         """Stop the proactive indexer."""
-        # Cancel reindex task if running
+        # Wake the reindex loop so it exits; cancel it if a check hangs
+        self._stop_event.set()
         if self._reindex_task and not self._reindex_task.done():
-            self._reindex_task.cancel()
             try:
-                await self._reindex_task
-            except asyncio.CancelledError:
+                await asyncio.wait_for(self._reindex_task, timeout=5.0)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
                 pass
-            self._reindex_task = None
+        self._reindex_task = None
 
         await self.scheduler.stop()
+        # Runs still queued in the scheduler will not start any more
+        self._inflight.clear()
+
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+            self._cpu_pool = None
+
         LOGGER.info("Proactive indexer stopped")
 
     async def _reindex_loop(self) -> None:
         """Periodically check and re-index stale content."""
+        # Check often enough to honour the shortest adaptive interval
+        check_interval = min(
+            self.settings.reindex_interval,
+            self.settings.min_reindex_interval,
+        )
         while True:
-            await asyncio.sleep(self.settings.reindex_interval)
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=check_interval)
+                break  # Stop requested
+            except asyncio.TimeoutError:
+                pass
 
             if not self.enabled:
                 break
@@ -109,19 +196,28 @@ class ProactiveIndexer:
 
     async def _check_stale_indexes(self) -> None:
         """Check for stale indexes and schedule re-indexing."""
-        now = time.time()
-        stale_urls: List[str] = []
-
-        for url, timestamp in self._indexed_urls.items():
-            age = now - timestamp
-            if age > self.settings.reindex_interval:
-                stale_urls.append(url)
+        now = time.monotonic()
+        heap = self._freshness_heap
+        stale: List[Tuple[float, float, str]] = []
+
+        while heap and len(stale) < 5:  # Limit batch size
+            entry = heap[0]
+            due_at, indexed_at, url = entry
+            if now <= due_at:
+                break
+            heapq.heappop(heap)
+            if self._indexed_mono.get(url) != indexed_at:
+                continue  # Superseded by a newer index
+            stale.append(entry)
 
-        for url in stale_urls[:5]:  # Limit batch size
-            await self.schedule_indexing(url, priority=5)
+        for entry in stale:
+            await self.schedule_indexing(entry[2], priority=5)
+            # Keep the entry so a failed re-index is retried next cycle; a
+            # successful one supersedes it with a newer timestamp.
+            heapq.heappush(heap, entry)
 
-        if stale_urls:
-            LOGGER.info("Scheduled %d stale URLs for re-indexing", len(stale_urls))
+        if stale:
+            LOGGER.info("Scheduled %d stale URLs for re-indexing", len(stale))
 
     async def schedule_indexing(
         self,
@@ -131,29 +227,78 @@ class ProactiveIndexer:
     ) -> str:
         """Schedule a URL for indexing.
 
-        Returns the task ID for tracking.
+        Returns the task ID for tracking. If the URL is already pending, the
+        ID of the existing task is returned instead of scheduling another.
         """
-        if url in self._pending_urls:
+        inflight = self._inflight.get(url)
+        if inflight is not None:
             LOGGER.debug("URL already pending: %s", url)
-            return ""
+            return inflight[0]
+
+        marker = object()
+        self._inflight[url] = ("", marker)
 
-        self._pending_urls.add(url)
+        def release() -> None:
+            if self._inflight.get(url, (None, None))[1] is marker:
+                del self._inflight[url]
 
         async def index_task() -> Dict[str, Any]:
             try:
                 return await self._index_url(url, topic)
             finally:
-                self._pending_urls.discard(url)
+                release()
+
+        try:
+            task_id = await self.scheduler.schedule(
+                name=f"index:{url[:50]}",
+                func=index_task,
+                priority=priority,
+                metadata={"url": url, "topic": topic},
+            )
+        except BaseException:
+            # Not queued (or inline execution failed); let the URL be retried
+            release()
+            raise
 
-        task_id = await self.scheduler.schedule(
-            name=f"index:{url[:50]}",
-            func=index_task,
-            priority=priority,
-            metadata={"url": url, "topic": topic},
-        )
+        # The task may already have run if the scheduler executed it inline
+        if self._inflight.get(url, (None, None))[1] is marker:
+            self._inflight[url] = (task_id, marker)
 
         return task_id
 
+    async def cancel_indexing(self, url: str) -> bool:
+        """Cancel a URL's pending indexing run so it can be scheduled again.
+
+        Cancel through here rather than ``scheduler.cancel_task``: a run
+        cancelled before it starts never releases its in-flight entry.
+        """
+        inflight = self._inflight.get(url)
+        if inflight is None or not inflight[0]:
+            return False
+        if not await self.scheduler.cancel_task(inflight[0]):
+            return False
+        if self._inflight.get(url) is inflight:
+            del self._inflight[url]
+        return True
+
+    async def schedule_indexing_bulk(
+        self,
+        urls: List[str],
+        topic: Optional[str] = None,
+        priority: int = 0,
+    ) -> List[str]:
+        """Schedule several URLs for indexing in one call.
+
+        Duplicate URLs in the batch are scheduled once. Returns one task ID
+        per distinct URL, in first-seen order.
+        """
+        task_ids: List[str] = []
+        for url in dict.fromkeys(urls):
+            task_ids.append(
+                await self.schedule_indexing(url, topic=topic, priority=priority)
+            )
+        return task_ids
+
     async def _index_url(
         self,
         url: str,
@@ -163,8 +308,8 @@ class ProactiveIndexer:
 
         Performs:
         1. Scrape the page
-        2. Extract code blocks for Zoekt
-        3. Build point list
+        2. Stop early if the content is unchanged since the last index
+        3. Extract code blocks for Zoekt and build the point list concurrently
         4. Store results
         """
         result: Dict[str, Any] = {
@@ -181,29 +326,55 @@ class ProactiveIndexer:
             LOGGER.warning("Failed to scrape %s", url)
             return result
 
-        # Extract and index code blocks
-        if self.config.zoekt.enabled:
-            code_blocks = self.zoekt_indexer.extract_code_blocks(page)
-            if code_blocks:
-                zoekt_result = await self.zoekt_indexer.index_pages(
-                    [page],
-                    repo_name=self._url_to_repo_name(url),
-                )
-                result["zoekt"] = zoekt_result
+        # Skip the pipeline when the content is the same as last time and its
+        # outputs are still held
+        digest = hashlib.blake2b(page.markdown.encode(), digest_size=16).hexdigest()
+        if self._url_hash.get(url) == digest and (
+            not self.config.point_list.enabled or url in self._point_lists
+        ):
+            self._mark_indexed(url, digest)
+            result["status"] = "unchanged"
+            LOGGER.debug("Content unchanged for %s, skipping re-index", url)
+            return result
+
+        # Code extraction and point list building only share the page, so run
+        # them concurrently. The point list task goes first so the build is
+        # already running in its worker while the Zoekt files are prepared.
+        point_list, zoekt_result = await asyncio.gather(
+            self._build_point_list(page),
+            self._index_code_blocks(page),
+            return_exceptions=True,
+        )
+        # A cancelled build (e.g. the worker pool shut down by stop()) comes
+        # back as a result rather than being raised
+        for outcome in (point_list, zoekt_result):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+
+        failed = False
+        if isinstance(zoekt_result, BaseException):
+            LOGGER.error("Zoekt indexing failed for %s: %s", url, zoekt_result)
+            failed = True
+        else:
+            result["zoekt"] = zoekt_result
 
-        # Build point list
         points_count = 0
-        if self.config.point_list.enabled:
-            point_list = self.point_list_builder.build(page)
-            self._point_lists[url] = point_list
+        if isinstance(point_list, BaseException):
+            LOGGER.error("Point list build failed for %s: %s", url, point_list)
+            failed = True
+        elif point_list is not None:
+            self._store_point_list(url, point_list)
             points_count = len(point_list.points)
             result["point_list"] = {
                 "id": point_list.id,
                 "points_count": points_count,
             }
 
-        # Mark as indexed
-        self._indexed_urls[url] = time.time()
+        # Mark as indexed; after a partial failure forget the digest so the
+        # next run does not treat the page as unchanged
+        self._mark_indexed(url, digest)
+        if failed:
+            self._url_hash.pop(url, None)
         result["status"] = "completed"
 
         LOGGER.info(
@@ -217,15 +388,96 @@ class ProactiveIndexer:
 
         return result
 
-    @staticmethod
-    def _url_to_repo_name(url: str) -> str:
-        """Convert a URL to a repository name for Zoekt."""
-        from urllib.parse import urlparse
+    async def _index_code_blocks(
+        self,
+        page: ScrapedPage,
+    ) -> Optional[Dict[str, Any]]:
+        """Extract and index code blocks from a page for Zoekt."""
+        if not self.config.zoekt.enabled:
+            return None
+        if not self.zoekt_indexer.extract_code_blocks(page):
+            return None
+        return await self.zoekt_indexer.index_pages(
+            [page],
+            repo_name=_url_to_repo_name(page.url),
+        )
+
+    async def _build_point_list(self, page: ScrapedPage) -> Optional[PointList]:
+        """Build the point list for a page off the event loop.
+
+        Always rebuilds, since re-indexing exists to pick up changed content.
+        """
+        if not self.config.point_list.enabled:
+            return None
+
+        point_list: Optional[PointList] = None
+        if self._cpu_pool is not None:
+            loop = asyncio.get_running_loop()
+            try:
+                point_list = await loop.run_in_executor(
+                    self._cpu_pool,
+                    _build_point_list_in_worker,
+                    page,
+                )
+            except BrokenProcessPool:
+                LOGGER.warning("Point list worker pool broke, using threads")
+                self._cpu_pool = None
+
+        if point_list is None:
+            point_list = await asyncio.to_thread(
+                self.point_list_builder.build_uncached,
+                page,
+            )
+
+        self.point_list_builder.cache_point_list(point_list)
+        return point_list
 
-        parsed = urlparse(url)
-        hostname = parsed.hostname or "unknown"
-        path = parsed.path.strip("/").replace("/", "_")[:30]
-        return f"{hostname}_{path}" if path else hostname
+    def _mark_indexed(self, url: str, digest: str) -> None:
+        """Record an index of a URL and schedule its next freshness check."""
+        ttl = self._update_ttl(url, digest)
+        indexed_at = time.monotonic()
+        self._indexed_urls[url] = time.time()
+        self._indexed_urls.move_to_end(url)
+        self._indexed_mono[url] = indexed_at
+        self._evict_indexed_urls()
+        heapq.heappush(self._freshness_heap, (indexed_at + ttl, indexed_at, url))
+
+    def _update_ttl(self, url: str, digest: str) -> float:
+        """Adapt the re-index interval of a URL to how often it changes."""
+        previous = self._url_hash.get(url)
+        ttl = self._url_ttl.get(url, float(self.settings.reindex_interval))
+
+        if previous is not None:
+            if previous == digest:
+                ttl = min(ttl * 2, self.settings.max_reindex_interval)
+            else:
+                ttl = max(ttl / 2, self.settings.min_reindex_interval)
+
+        self._url_hash[url] = digest
+        self._url_ttl[url] = ttl
+        return ttl
+
+    def _evict_indexed_urls(self) -> None:
+        """Forget the least recently indexed URLs beyond the tracking cap."""
+        while len(self._indexed_urls) > self.settings.max_tracked_urls:
+            url, _ = self._indexed_urls.popitem(last=False)
+            # Heap entries for the URL become stale and are skipped when popped
+            self._indexed_mono.pop(url, None)
+            self._url_ttl.pop(url, None)
+            self._url_hash.pop(url, None)
+            self._evicted_urls += 1
+
+    def _store_point_list(self, url: str, point_list: PointList) -> None:
+        """Store a point list, evicting the least recently used beyond the cap."""
+        self._point_lists[url] = point_list
+        self._point_lists.move_to_end(url)
+        while len(self._point_lists) > self.settings.max_point_lists:
+            self._point_lists.popitem(last=False)
+            self._evicted_point_lists += 1
+
+    def get_reindex_interval(self, url: str) -> float:
+        """Get the current re-index interval for a URL in seconds."""
+        return self._url_ttl.get(url, float(self.settings.reindex_interval))
 
     async def index_topic(
         self,
@@ -249,16 +501,20 @@ class ProactiveIndexer:
                 "topic": topic,
             }
 
-        # Schedule indexing for each candidate
-        task_ids: List[str] = []
-        for idx, candidate in enumerate(candidates):
-            task_id = await self.schedule_indexing(
-                url=candidate.url,
-                topic=topic,
-                priority=idx,  # Earlier results get higher priority
+        # Schedule indexing for all candidates at once; the scheduler's
+        # priority queue still runs earlier results first and the scraper's
+        # semaphore bounds how many fetches run concurrently.
+        scheduled = await asyncio.gather(
+            *(
+                self.schedule_indexing(
+                    url=candidate.url,
+                    topic=topic,
+                    priority=idx,  # Earlier results get higher priority
+                )
+                for idx, candidate in enumerate(candidates)
             )
-            if task_id:
-                task_ids.append(task_id)
+        )
+        task_ids = [task_id for task_id in scheduled if task_id]
 
         return {
             "status": "scheduled",
@@ -272,17 +528,22 @@ class ProactiveIndexer:
         if not self.enabled or not self.settings.auto_index_on_scrape:
             return
 
-        if page.url in self._indexed_urls:
-            # Already indexed, check if stale
-            age = time.time() - self._indexed_urls[page.url]
-            if age < self.settings.reindex_interval:
-                return
+        # Already indexed and still fresh
+        timestamp = self._indexed_mono.get(page.url)
+        if (
+            timestamp is not None
+            and time.monotonic() - timestamp < self.get_reindex_interval(page.url)
+        ):
+            return
 
         await self.schedule_indexing(page.url, priority=1)
 
     def get_point_list(self, url: str) -> Optional[PointList]:
         """Get the point list for a URL if available."""
-        return self._point_lists.get(url)
+        point_list = self._point_lists.get(url)
+        if point_list is not None:
+            self._point_lists.move_to_end(url)
+        return point_list
 
     def get_all_point_lists(self) -> List[PointList]:
         """Get all indexed point lists."""
@@ -294,10 +555,10 @@ class ProactiveIndexer:
 
     def get_index_age(self, url: str) -> Optional[float]:
         """Get the age of an index in seconds."""
-        timestamp = self._indexed_urls.get(url)
+        timestamp = self._indexed_mono.get(url)
         if timestamp is None:
             return None
-        return time.time() - timestamp
+        return time.monotonic() - timestamp
 
     def get_stats(self) -> Dict[str, Any]:
         """Get indexer statistics."""
@@ -305,7 +566,9 @@ class ProactiveIndexer:
             "enabled": self.enabled,
             "indexed_urls": len(self._indexed_urls),
             "point_lists": len(self._point_lists),
-            "pending_urls": len(self._pending_urls),
+            "evicted_urls": self._evicted_urls,
+            "evicted_point_lists": self._evicted_point_lists,
+            "pending_urls": len(self._inflight),
             "scheduler": self.scheduler.get_stats(),
             "zoekt": self.zoekt_indexer.get_index_stats(),
             "point_list_builder": self.point_list_builder.get_stats(),
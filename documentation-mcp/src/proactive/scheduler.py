@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
+import secrets
 import time
-import uuid
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any, Awaitable, Callable, Dict, List, Optional
@@ -14,6 +16,12 @@ from ..settings import Config
 
 LOGGER = logging.getLogger(__name__)
 
+# Maximum number of evicted tasks kept for reuse by schedule()
+TASK_POOL_SIZE = 1024
+
+# Maximum number of queue entries a worker takes per wakeup under backlog
+WORKER_BATCH_SIZE = 8
+
 
 class TaskStatus(Enum):
     """Status of a scheduled task."""
@@ -25,7 +33,12 @@ class TaskStatus(Enum):
     CANCELLED = auto()
 
 
-@dataclass
+TERMINAL_STATUSES = frozenset(
+    {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED}
+)
+
+
+@dataclass(slots=True)
 class ScheduledTask:
     """A task scheduled for background execution."""
 
@@ -38,18 +51,48 @@ class ScheduledTask:
     error: Optional[str] = None
     result: Optional[Any] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Monotonic counterparts of started_at/completed_at, used for durations
+    started_mono: Optional[float] = field(default=None, init=False, repr=False)
+    completed_mono: Optional[float] = field(default=None, init=False, repr=False)
+    # Serialized form, cached once the task reaches a terminal status
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def reset(
+        self,
+        task_id: str,
+        name: str,
+        metadata: Dict[str, Any],
+    ) -> None:
+        """Reinitialize a recycled task as a new pending task."""
+        self.task_id = task_id
+        self.name = name
+        self.status = TaskStatus.PENDING
+        self.created_at = time.time()
+        self.started_at = None
+        self.completed_at = None
+        self.error = None
+        self.result = None
+        self.metadata = metadata
+        self.started_mono = None
+        self.completed_mono = None
+        self._dict_cache = None
 
     @property
     def duration(self) -> Optional[float]:
         """Get task duration in seconds."""
-        if self.started_at is None:
+        if self.started_mono is None:
             return None
-        end_time = self.completed_at or time.time()
-        return end_time - self.started_at
+        end_time = self.completed_mono or time.monotonic()
+        return end_time - self.started_mono
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize task to dictionary."""
-        return {
+        if self._dict_cache is not None:
+            return self._dict_cache
+
+        data = {
             "task_id": self.task_id,
             "name": self.name,
             "status": self.status.name,
@@ -60,6 +103,9 @@ class ScheduledTask:
             "error": self.error,
             "metadata": self.metadata,
         }
+        if self.status in TERMINAL_STATUSES:
+            self._dict_cache = data
+        return data
 
 
 class BackgroundScheduler:
@@ -78,14 +124,30 @@ class BackgroundScheduler:
         self._max_concurrent = self.settings.max_concurrent_indexing
         self._queue_size = self.settings.index_queue_size
 
-        self._tasks: Dict[str, ScheduledTask] = {}
-        self._queue: asyncio.Queue[tuple[int, str, Callable[[], Awaitable[Any]]]] = (
-            asyncio.Queue(maxsize=self._queue_size)
-        )
+        self._history_size = self.settings.task_history_size
+
+        # Queued and running tasks; finished ones move to the bounded history,
+        # oldest first, so memory stays capped in long-running processes.
+        self._active: Dict[str, ScheduledTask] = {}
+        self._history: OrderedDict[str, ScheduledTask] = OrderedDict()
+        self._task_pool: deque[ScheduledTask] = deque(maxlen=TASK_POOL_SIZE)
+        # Per-status index kept in step with every transition so listings and
+        # stats do not scan all tasks; inner dicts keep insertion order.
+        self._by_status: Dict[TaskStatus, Dict[str, ScheduledTask]] = {
+            status: {} for status in TaskStatus
+        }
+        # Entries are (priority, seq, task_id, func); seq breaks priority ties
+        # in FIFO order so the coroutine functions are never compared.
+        self._queue: asyncio.PriorityQueue[
+            tuple[int, int, str, Callable[[], Awaitable[Any]]]
+        ] = asyncio.PriorityQueue(maxsize=self._queue_size)
+        self._seq_counter = itertools.count()
         self._running_count = 0
+        # Set whenever no task is executing; stop() waits on it.
+        self._idle = asyncio.Event()
+        self._idle.set()
         self._shutdown = False
         self._workers: List[asyncio.Task[None]] = []
-        self._lock = asyncio.Lock()
 
     @property
     def enabled(self) -> bool:
@@ -113,12 +175,10 @@ class BackgroundScheduler:
         self._shutdown = True
 
         # Wait for running tasks to complete
-        start_time = time.time()
-        while self._running_count > 0:
-            if time.time() - start_time > timeout:
-                LOGGER.warning("Timeout waiting for tasks to complete")
-                break
-            await asyncio.sleep(0.1)
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            LOGGER.warning("Timeout waiting for tasks to complete")
 
         # Cancel workers
         for worker in self._workers:
@@ -156,22 +216,29 @@ class BackgroundScheduler:
                 LOGGER.error("Sync execution failed: %s", exc)
                 raise
 
-        task_id = str(uuid.uuid4())[:8]
-        task = ScheduledTask(
-            task_id=task_id,
-            name=name,
-            metadata=metadata or {},
-        )
-
-        async with self._lock:
-            self._tasks[task_id] = task
+        task_id = secrets.token_hex(4)
+        if self._task_pool:
+            task = self._task_pool.pop()
+            task.reset(task_id, name, metadata or {})
+        else:
+            task = ScheduledTask(
+                task_id=task_id,
+                name=name,
+                metadata=metadata or {},
+            )
+
+        # All scheduler state is only touched from the event loop thread, so
+        # plain dict/counter updates need no lock.
+        self._active[task_id] = task
+        self._by_status[task.status][task_id] = task
 
         try:
-            await self._queue.put((priority, task_id, func))
+            await self._queue.put((priority, next(self._seq_counter), task_id, func))
             LOGGER.debug("Scheduled task %s: %s", task_id, name)
         except asyncio.QueueFull:
-            task.status = TaskStatus.FAILED
+            self._set_status(task, TaskStatus.FAILED)
             task.error = "Queue is full"
+            self._retire(task)
             LOGGER.warning("Failed to schedule task %s: queue full", name)
 
         return task_id
@@ -184,42 +251,28 @@ class BackgroundScheduler:
             try:
                 # Wait for a task with timeout
                 try:
-                    priority, task_id, func = await asyncio.wait_for(
+                    entry = await asyncio.wait_for(
                         self._queue.get(),
                         timeout=1.0,
                     )
                 except asyncio.TimeoutError:
                     continue
 
-                task = self._tasks.get(task_id)
-                if not task:
-                    continue
-
-                # Execute the task
-                async with self._lock:
-                    self._running_count += 1
-
-                task.status = TaskStatus.RUNNING
-                task.started_at = time.time()
-
-                try:
-                    result = await func()
-                    task.status = TaskStatus.COMPLETED
-                    task.result = result
-                    LOGGER.debug(
-                        "Task %s completed in %.2fs",
-                        task.name,
-                        task.duration,
-                    )
-                except Exception as exc:
-                    task.status = TaskStatus.FAILED
-                    task.error = str(exc)
-                    LOGGER.error("Task %s failed: %s", task.name, exc)
-                finally:
-                    task.completed_at = time.time()
-                    async with self._lock:
-                        self._running_count -= 1
-                    self._queue.task_done()
+                # With a deep backlog, take several entries per wakeup; other
+                # workers still have plenty left to pick up
+                batch = [entry]
+                if self._queue.qsize() > len(self._workers) * 2:
+                    while len(batch) < WORKER_BATCH_SIZE:
+                        try:
+                            batch.append(self._queue.get_nowait())
+                        except asyncio.QueueEmpty:
+                            break
+
+                for index, (_priority, _seq, task_id, func) in enumerate(batch):
+                    if self._shutdown:
+                        self._requeue(batch[index:])
+                        break
+                    await self._run_task(task_id, func)
 
             except asyncio.CancelledError:
                 break
@@ -228,58 +281,130 @@ class BackgroundScheduler:
 
         LOGGER.debug("Worker %s stopped", worker_name)
 
+    async def _run_task(
+        self,
+        task_id: str,
+        func: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """Execute one dequeued task and record its outcome."""
+        task = self._active.get(task_id)
+        if not task or task.status != TaskStatus.PENDING:
+            self._queue.task_done()
+            return  # Unknown or cancelled while queued
+
+        self._running_count += 1
+        self._idle.clear()
+
+        self._set_status(task, TaskStatus.RUNNING)
+        task.started_at = time.time()
+        task.started_mono = time.monotonic()
+
+        try:
+            result = await func()
+            self._set_status(task, TaskStatus.COMPLETED)
+            task.result = result
+            LOGGER.debug(
+                "Task %s completed in %.2fs",
+                task.name,
+                task.duration,
+            )
+        except Exception as exc:
+            self._set_status(task, TaskStatus.FAILED)
+            task.error = str(exc)
+            LOGGER.error("Task %s failed: %s", task.name, exc)
+        finally:
+            self._retire(task)
+            self._running_count -= 1
+            if self._running_count == 0:
+                self._idle.set()
+            self._queue.task_done()
+
+    def _requeue(
+        self,
+        entries: List[tuple[int, int, str, Callable[[], Awaitable[Any]]]],
+    ) -> None:
+        """Put back dequeued entries that were not run before shutdown."""
+        for entry in entries:
+            self._queue.task_done()
+            try:
+                self._queue.put_nowait(entry)
+            except asyncio.QueueFull:
+                LOGGER.warning("Dropping task %s on shutdown: queue full", entry[2])
+
+    def _set_status(self, task: ScheduledTask, status: TaskStatus) -> None:
+        """Transition a task to a new status, keeping the index in step."""
+        self._by_status[task.status].pop(task.task_id, None)
+        task.status = status
+        self._by_status[status][task.task_id] = task
+
+    def _retire(self, task: ScheduledTask) -> None:
+        """Move a task that reached a terminal status into the history."""
+        task.completed_at = time.time()
+        task.completed_mono = time.monotonic()
+        self._active.pop(task.task_id, None)
+        self._history[task.task_id] = task
+        if len(self._history) > self._history_size:
+            self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        """Drop the oldest task from the history."""
+        task_id, task = self._history.popitem(last=False)
+        self._by_status[task.status].pop(task_id, None)
+        # No longer reachable by ID, so the object can back a future task
+        self._task_pool.append(task)
+
     def get_task(self, task_id: str) -> Optional[ScheduledTask]:
-        """Get task by ID."""
-        return self._tasks.get(task_id)
+        """Get task by ID.
+
+        Tasks evicted from the history are recycled, so callers should not
+        keep the returned object beyond the current operation.
+        """
+        return self._active.get(task_id) or self._history.get(task_id)
 
     def get_all_tasks(self) -> List[ScheduledTask]:
         """Get all tasks."""
-        return list(self._tasks.values())
+        return [*self._active.values(), *self._history.values()]
 
     def get_pending_tasks(self) -> List[ScheduledTask]:
         """Get all pending tasks."""
-        return [t for t in self._tasks.values() if t.status == TaskStatus.PENDING]
+        return list(self._by_status[TaskStatus.PENDING].values())
 
     def get_running_tasks(self) -> List[ScheduledTask]:
         """Get all running tasks."""
-        return [t for t in self._tasks.values() if t.status == TaskStatus.RUNNING]
+        return list(self._by_status[TaskStatus.RUNNING].values())
 
     async def cancel_task(self, task_id: str) -> bool:
         """Cancel a pending task."""
-        task = self._tasks.get(task_id)
+        task = self._active.get(task_id)
         if not task or task.status != TaskStatus.PENDING:
             return False
 
-        task.status = TaskStatus.CANCELLED
-        task.completed_at = time.time()
+        self._set_status(task, TaskStatus.CANCELLED)
+        self._retire(task)
         return True
 
     def clear_completed(self, max_age: float = 3600.0) -> int:
         """Clear completed tasks older than max_age seconds."""
-        now = time.time()
+        now = time.monotonic()
         cleared = 0
 
-        to_remove = [
-            task_id
-            for task_id, task in self._tasks.items()
-            if task.status
-            in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
-            and task.completed_at
-            and now - task.completed_at > max_age
-        ]
-
-        for task_id in to_remove:
-            del self._tasks[task_id]
+        # History is ordered by completion time, oldest first
+        while self._history:
+            task = next(iter(self._history.values()))
+            if now - (task.completed_mono or now) <= max_age:
+                break
+            self._evict_oldest()
             cleared += 1
 
         return cleared
 
     def get_stats(self) -> Dict[str, Any]:
         """Get scheduler statistics."""
-        status_counts: Dict[str, int] = {}
-        for task in self._tasks.values():
-            status = task.status.name
-            status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts = {
+            status.name: len(tasks)
+            for status, tasks in self._by_status.items()
+            if tasks
+        }
 
         return {
             "enabled": self.enabled,
@@ -287,6 +412,6 @@ class BackgroundScheduler:
             "queue_size": self._queue.qsize(),
             "max_queue_size": self._queue_size,
             "running_count": self._running_count,
-            "total_tasks": len(self._tasks),
+            "total_tasks": len(self._active) + len(self._history),
             "tasks_by_status": status_counts,
         }
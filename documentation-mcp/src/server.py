@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
 
 from mcp.server.fastmcp import FastMCP
 
@@ -17,7 +18,7 @@ from .enhanced_search import EnhancedSearchEngine
 from .proactive.indexer import ProactiveIndexer
 from .settings import Config, load_config
 from .site_identifier import SiteIdentifier
-from .web_scraper import WebScraper
+from .web_scraper import ScrapedPage, WebScraper
 
 LOGGER = logging.getLogger(__name__)
 
@@ -74,12 +75,41 @@ class DocumentationMCPServer:
             site_identifier=self.site_identifier,
         )
 
+        # In-flight tool calls keyed by (tool name, arguments)
+        self._inflight: Dict[Tuple[Hashable, ...], asyncio.Task] = {}
+        # Background warm-up started with the background services
+        self._warmup_task: Optional[asyncio.Task] = None
+
         self._register_tools()
 
+    def _coalesce(
+        self, func: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """Share one execution between concurrent identical tool calls.
+
+        The first call runs the tool; calls with the same arguments that
+        arrive while it is in flight await the same task instead of
+        repeating the search/LLM work.
+        """
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.create_task(func(*args, **kwargs))
+                self._inflight[key] = task
+                task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            # Shield so one caller's cancellation does not cancel the others
+            return await asyncio.shield(task)
+
+        return wrapper
+
     def _register_tools(self) -> None:
         # ============= Existing Tools =============
 
         @self.app.tool()
+        @self._coalesce
         async def search_documentation(
             query: str, code_context: Optional[str] = None
         ) -> dict:
@@ -88,6 +118,7 @@ class DocumentationMCPServer:
             return await self.rag_engine.search(query=query, code_context=code_context)
 
         @self.app.tool()
+        @self._coalesce
         async def get_site_context(site_url: str, topic: Optional[str] = None) -> dict:
             """Fetches deeper context for a specific documentation site."""
             LOGGER.info("get_site_context invoked", extra={"site_url": site_url})
@@ -96,6 +127,7 @@ class DocumentationMCPServer:
             )
 
         @self.app.tool()
+        @self._coalesce
         async def explore_related(topic: str, depth: int = 1) -> dict:
             """Recursively explores related documentation topics."""
             LOGGER.info(
@@ -104,6 +136,7 @@ class DocumentationMCPServer:
             return await self.deep_search.explore(topic=topic, depth=depth)
 
         @self.app.tool()
+        @self._coalesce
         async def get_examples(query: str, language: Optional[str] = None) -> dict:
             """Retrieves code examples relevant to the query."""
             LOGGER.info(
@@ -112,6 +145,7 @@ class DocumentationMCPServer:
             return await self.rag_engine.get_examples(query=query, language=language)
 
         @self.app.tool()
+        @self._coalesce
         async def validate_info(statement: str) -> dict:
             """Validates documentation statements across multiple sources."""
             LOGGER.info("validate_info invoked")
@@ -120,6 +154,7 @@ class DocumentationMCPServer:
         # ============= New Enhanced Search Tools =============
 
         @self.app.tool()
+        @self._coalesce
         async def instant_search(
             query: str,
             include_code: bool = True,
@@ -163,18 +198,7 @@ class DocumentationMCPServer:
             )
             return {
                 "query": query,
-                "results": [
-                    {
-                        "file_path": r.file_path,
-                        "language": r.language,
-                        "snippet": r.snippet,
-                        "line_number": r.line_number,
-                        "context": r.context,
-                        "score": r.score,
-                        "source_url": r.source_url,
-                    }
-                    for r in results
-                ],
+                "results": [r.to_dict() for r in results],
                 "count": len(results),
             }
 
@@ -191,18 +215,7 @@ class DocumentationMCPServer:
             results = await self.enhanced_search.search_concepts(query, limit=limit)
             return {
                 "query": query,
-                "results": [
-                    {
-                        "id": p.id,
-                        "type": p.point_type.name,
-                        "name": p.name,
-                        "description": p.description,
-                        "source_url": p.source_url,
-                        "confidence": p.confidence,
-                        "metadata": p.metadata,
-                    }
-                    for p in results
-                ],
+                "results": [p.to_dict() for p in results],
                 "count": len(results),
             }
 
@@ -229,6 +242,7 @@ class DocumentationMCPServer:
         # ============= Proactive Indexing Tools =============
 
         @self.app.tool()
+        @self._coalesce
         async def index_topic(
             topic: str,
             limit: int = 5,
@@ -280,6 +294,7 @@ class DocumentationMCPServer:
         # ============= Documentation Loading Tools =============
 
         @self.app.tool()
+        @self._coalesce
         async def load_documentation_from_url(
             url: str,
             follow_links: bool = False,
@@ -350,6 +365,7 @@ class DocumentationMCPServer:
             }
 
         @self.app.tool()
+        @self._coalesce
         async def load_documentation_by_name(
             name: str,
             auto_scrape: bool = True,
@@ -393,6 +409,7 @@ class DocumentationMCPServer:
             }
 
         @self.app.tool()
+        @self._coalesce
         async def find_documentation(
             name: str,
             max_results: int = 5,
@@ -418,19 +435,12 @@ class DocumentationMCPServer:
             
             return {
                 "name": name,
-                "candidates": [
-                    {
-                        "title": c.title,
-                        "url": c.url,
-                        "snippet": c.snippet,
-                        "confidence": c.confidence,
-                    }
-                    for c in candidates
-                ],
+                "candidates": [c.to_dict() for c in candidates],
                 "count": len(candidates),
             }
 
         @self.app.tool()
+        @self._coalesce
         async def terminology_search(
             query: str,
             use_knowledge_graph: bool = True,
@@ -482,26 +492,41 @@ class DocumentationMCPServer:
         loaded: LoadedDocumentation,
     ) -> Dict[str, Any]:
         """Process loaded documentation: extract terminology and index."""
-        total_terms = 0
-        indexed_pages = 0
-        
-        for page in loaded.pages:
+        semaphore = asyncio.Semaphore(self.config.scraping.max_concurrent_requests)
+
+        async def process_page(page: ScrapedPage) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.rag_engine.extract_and_index_terminology(page)
+
+        # Queue every page for code search in one call while terminology is
+        # extracted; the two do not depend on each other
+        indexing = asyncio.create_task(
+            self.proactive_indexer.schedule_indexing_bulk(
+                [page.url for page in loaded.pages],
+                topic=loaded.source,
+            )
+        )
+        try:
+            results = await asyncio.gather(
+                *(process_page(page) for page in loaded.pages),
+                return_exceptions=True,
+            )
+        finally:
             try:
-                # Extract and index terminology
-                result = await self.rag_engine.extract_and_index_terminology(page)
-                if result.get("status") == "success":
-                    total_terms += result.get("terms_extracted", 0)
-                    indexed_pages += 1
-                
-                # Also index for code search
-                await self.proactive_indexer.schedule_indexing(
-                    page.url,
-                    topic=loaded.source,
-                )
-                
+                await indexing
             except Exception as exc:
-                LOGGER.warning("Failed to process page %s: %s", page.url, exc)
-        
+                LOGGER.warning("Failed to schedule indexing for %s: %s", loaded.source, exc)
+
+        total_terms = 0
+        indexed_pages = 0
+        for page, result in zip(loaded.pages, results):
+            if isinstance(result, Exception):
+                LOGGER.warning("Failed to process page %s: %s", page.url, result)
+                continue
+            if result.get("status") == "success":
+                total_terms += result.get("terms_extracted", 0)
+                indexed_pages += 1
+
         return {
             "terms_extracted": total_terms,
             "pages_indexed": indexed_pages,
@@ -509,14 +534,39 @@ class DocumentationMCPServer:
 
     async def _start_background_services(self) -> None:
         """Start background services like proactive indexing."""
+        self.site_identifier.open()
         if self.config.proactive.enabled:
             await self.proactive_indexer.start()
+        self._warmup_task = asyncio.create_task(self._warmup())
+
+    async def _warmup(self) -> None:
+        """Prime local state off the request path.
+
+        site_identifier.open() already creates a DDGS client in the search
+        pool; this runs one embedding so the first query does not pay for
+        model kernel initialization. No network request is made. Failures
+        are ignored; warm-up is best effort.
+        """
+        try:
+            await asyncio.to_thread(
+                self.content_processor.model.encode,
+                ["documentation"],
+                show_progress_bar=False,
+                convert_to_numpy=True,
+            )
+        except Exception as exc:  # pragma: no cover - best effort
+            LOGGER.debug("Embedding warm-up failed", extra={"error": str(exc)})
 
     async def _stop_background_services(self) -> None:
         """Stop background services."""
+        if self._warmup_task is not None and not self._warmup_task.done():
+            self._warmup_task.cancel()
         if self.config.proactive.enabled:
             await self.proactive_indexer.stop()
         await self.enhanced_search.close()
+        await self.rag_engine.close()
+        await self.web_scraper.close()
+        self.site_identifier.close()
 
     async def run(self) -> None:
         """Starts the MCP server blocking run loop."""
@@ -2,18 +2,28 @@
 
 from __future__ import annotations
 
+import copy
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+try:  # libyaml-backed loader parses several times faster when available
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 DEFAULT_CONFIG_PATH = Path("config/config.yaml")
 ENV_CONFIG_PATH = "DOCUMENTATION_MCP_CONFIG"
 
+# Parsed YAML per resolved path, tagged with the file's mtime in ns so an
+# edit invalidates it
+_RAW_CONFIG_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
 
-@dataclass
+@dataclass(slots=True)
 class ServerSettings:
     name: str
     version: str
@@ -21,43 +31,53 @@ class ServerSettings:
     port: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingSettings:
     max_concurrent_requests: int
     request_delay: float
     timeout: int
     user_agent: str
+    # Open connections kept per documentation host by the shared session
+    max_connections_per_host: int = 8
+    # Store pages with their ETag/Last-Modified and revalidate on re-fetch
+    http_cache: bool = True
+    # Least recently used pages beyond this many are dropped from the cache
+    http_cache_max_entries: int = 5000
+    # Pages not fetched or revalidated for this many seconds are dropped
+    http_cache_max_age: int = 604800
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheSettings:
     ttl: int
     max_size: int
     storage_path: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RAGSettings:
     embedding_model: str
     chunk_size: int
     chunk_overlap: int
     max_context_length: int
+    # Chunk embeddings kept in memory, keyed by chunk text hash
+    embedding_cache_size: int = 10000
 
 
-@dataclass
+@dataclass(slots=True)
 class AISettings:
     model: str
     temperature: float
     max_tokens: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SiteSettings:
     patterns: List[str] = field(default_factory=list)
     excluded_domains: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoektSettings:
     enabled: bool = True
     server_url: str = "http://localhost:6070"
@@ -65,18 +85,28 @@ class ZoektSettings:
     timeout: int = 30
     max_results: int = 100
     context_lines: int = 2
+    # Seconds to reuse identical search results (0 disables). Also bounds how
+    # long results can lag behind the Zoekt server's re-indexing
+    search_cache_ttl: int = 60
+    search_cache_size: int = 256
+    repos_cache_ttl: int = 30  # seconds to reuse the indexed repository listing
 
 
-@dataclass
+@dataclass(slots=True)
 class ProactiveSettings:
     enabled: bool = True
     max_concurrent_indexing: int = 3
     index_queue_size: int = 100
     reindex_interval: int = 3600
+    min_reindex_interval: int = 900
+    max_reindex_interval: int = 86400
     auto_index_on_scrape: bool = True
+    task_history_size: int = 10000
+    max_tracked_urls: int = 10000
+    max_point_lists: int = 1000
 
 
-@dataclass
+@dataclass(slots=True)
 class PointListSettings:
     enabled: bool = True
     max_points_per_doc: int = 50
@@ -86,7 +116,7 @@ class PointListSettings:
     build_relationships: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class TerminologySettings:
     enabled: bool = True
     max_terms_per_page: int = 30
@@ -96,9 +126,18 @@ class TerminologySettings:
     confidence_threshold: float = 0.6
     build_knowledge_graph: bool = True
     auto_extract_on_scrape: bool = True
-
-
-@dataclass
+    # Pages packed into one AI extraction prompt (1 = one request per page);
+    # capped so each page gets 1000 of ai.max_tokens completion tokens
+    ai_pages_per_request: int = 5
+    # LLM extraction requests allowed in flight at once
+    ai_concurrency: int = 4
+    # Token budget for each page's content in an AI extraction prompt
+    ai_prompt_tokens: int = 500
+    # Token budget for the term descriptions packed into one AI scoring prompt
+    ai_scoring_prompt_tokens: int = 3000
+
+
+@dataclass(slots=True)
 class Config:
     server: ServerSettings
     scraping: ScrapingSettings
@@ -126,7 +165,7 @@ def _read_config_file(path: Path) -> Dict[str, Any]:
 
     try:
         with path.open("r", encoding="utf-8") as handle:
-            return yaml.safe_load(handle) or {}
+            return yaml.load(handle, Loader=_YamlLoader) or {}
     except yaml.YAMLError as exc:
         raise ConfigError(f"Failed to parse YAML config: {exc}") from exc
 
@@ -184,5 +223,19 @@ def load_config(path: Optional[str] = None) -> Config:
     """Load configuration from YAML into strongly typed dataclasses."""
 
     config_path = _resolve_config_path(path)
-    raw_config = _read_config_file(config_path)
-    return _build_config_objects(raw_config)
+    try:
+        mtime_ns: Optional[int] = config_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+
+    cached = _RAW_CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == mtime_ns:
+        raw_config = cached[1]
+    else:
+        raw_config = _read_config_file(config_path)
+        if mtime_ns is not None:
+            _RAW_CONFIG_CACHE[config_path] = (mtime_ns, raw_config)
+
+    # Each caller gets its own objects, so mutating one Config cannot leak
+    # into later loads
+    return _build_config_objects(copy.deepcopy(raw_config))
@@ -2,23 +2,77 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from fnmatch import fnmatch
-from typing import Dict, List, Optional
+from fnmatch import translate
+from typing import Any, Dict, List, Optional, Pattern, Sequence, Tuple
 from urllib.parse import urlparse
 
 from duckduckgo_search import DDGS
 
 from .settings import Config
 
+# Search results are reused for this long before querying DuckDuckGo again
+SEARCH_CACHE_TTL = 300.0
+SEARCH_CACHE_SIZE = 1024
 
-@dataclass
+# Query words treated as equivalent when building the search cache key
+_QUERY_SYNONYMS = {"docs": "documentation", "doc": "documentation"}
+
+# Keywords that suggest a result is documentation
+_TITLE_KEYWORDS = ("doc", "guide", "reference")
+_SNIPPET_KEYWORDS = ("syntax", "api", "usage")
+
+
+def _compile_host_patterns(patterns: Sequence[str]) -> Optional[Pattern[str]]:
+    """Combine glob-style host patterns into a single regex."""
+    if not patterns:
+        return None
+    return re.compile("|".join(translate(pattern) for pattern in patterns))
+
+
+def _fast_host(url: str) -> str:
+    """Extract the lowercase hostname from an absolute URL in one pass.
+
+    Falls back to ``urlparse`` for bracketed IPv6 hosts.
+    """
+    netloc = url.partition("://")[2] or url
+    for sep in "/?#":
+        netloc = netloc.partition(sep)[0]
+    netloc = netloc.rpartition("@")[2]
+    if netloc.startswith("["):
+        return urlparse(url).hostname or ""
+    return netloc.partition(":")[0].lower()
+
+
+@functools.lru_cache(maxsize=4096)
+def _enrich(query: str, language: Optional[str]) -> str:
+    """Build the search query sent to DuckDuckGo for a user query."""
+    if language:
+        return f"{query} {language} documentation"
+    return f"{query} documentation"
+
+
+@dataclass(slots=True)
 class SiteCandidate:
     title: str
     url: str
     snippet: str
     confidence: float
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "url": self.url,
+            "snippet": self.snippet,
+            "confidence": self.confidence,
+        }
+
 
 class SiteIdentifier:
     """Uses search heuristics to discover documentation sites."""
@@ -27,58 +81,159 @@ class SiteIdentifier:
         self.config = config
         self._patterns = config.sites.patterns
         self._exclusions = config.sites.excluded_domains
+        self._pattern_re = _compile_host_patterns(self._patterns)
+        self._exclusion_re = _compile_host_patterns(self._exclusions)
+        # One DDGS client per search thread, reused across its searches, so
+        # concurrent searches never share a client; every client created is
+        # also listed here so close() can release it
+        self._ddgs_local = threading.local()
+        self._ddgs_clients: List[DDGS] = []
+        self._ddgs_lock = threading.Lock()
+        # (normalized query, limit) -> (timestamp, candidates), oldest first
+        self._search_cache: OrderedDict[
+            Tuple[str, int], Tuple[float, List[SiteCandidate]]
+        ] = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        # Searches block on network I/O; run them on a dedicated pool so they
+        # do not queue behind other users of the loop's default executor
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Build a cache key that ignores case, spacing and synonym choice.
+
+        Word order is kept: "python to c++" and "c++ to python" differ.
+        """
+        return " ".join(_QUERY_SYNONYMS.get(word, word) for word in query.lower().split())
+
+    def _get_cached_search(self, key: Tuple[str, int]) -> Optional[List[SiteCandidate]]:
+        with self._search_cache_lock:
+            cached = self._search_cache.get(key)
+            if cached is None:
+                return None
+            timestamp, candidates = cached
+            if time.monotonic() - timestamp > SEARCH_CACHE_TTL:
+                del self._search_cache[key]
+                return None
+            self._search_cache.move_to_end(key)
+            return list(candidates)
+
+    def _set_cached_search(
+        self,
+        key: Tuple[str, int],
+        candidates: List[SiteCandidate],
+    ) -> None:
+        with self._search_cache_lock:
+            self._search_cache[key] = (time.monotonic(), list(candidates))
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+
+    def open(self) -> None:
+        """Start the search pool and create a first DDGS client in it.
+
+        Purely local: no search is sent until the first real query.
+        """
+        self._get_executor().submit(self._get_ddgs)
+
+    def close(self) -> None:
+        """Release the search thread pool and every DDGS client."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        with self._ddgs_lock:
+            clients, self._ddgs_clients = self._ddgs_clients, []
+        for client in clients:
+            client.__exit__(None, None, None)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config.scraping.max_concurrent_requests,
+                thread_name_prefix="ddgs",
+            )
+        return self._executor
+
+    def _get_ddgs(self) -> DDGS:
+        """Return the calling thread's DDGS client, creating it on first use."""
+        client = getattr(self._ddgs_local, "client", None)
+        if client is None:
+            with self._ddgs_lock:
+                client = DDGS()
+                self._ddgs_clients.append(client)
+            self._ddgs_local.client = client
+        return client
+
+    def _text_search(self, query: str, max_results: int) -> List[Dict[str, str]]:
+        return list(self._get_ddgs().text(query, max_results=max_results) or [])
 
     def _matches_patterns(self, hostname: str) -> bool:
-        if not self._patterns:
+        if self._pattern_re is None:
             return True
-        return any(fnmatch(hostname, pattern) for pattern in self._patterns)
+        return self._pattern_re.match(hostname) is not None
 
     def _is_excluded(self, hostname: str) -> bool:
-        return any(fnmatch(hostname, pattern) for pattern in self._exclusions)
+        if self._exclusion_re is None:
+            return False
+        return self._exclusion_re.match(hostname) is not None
 
-    def _score_result(self, url: str, title: str, snippet: str) -> float:
+    def _score_result(self, host_matches: bool, title: str, snippet: str) -> float:
         score = 0.5
-        hostname = urlparse(url).hostname or ""
-        if self._matches_patterns(hostname):
+        if host_matches:
             score += 0.3
-        if any(keyword in title.lower() for keyword in ("doc", "guide", "reference")):
+        title_lower = title.lower()
+        if any(keyword in title_lower for keyword in _TITLE_KEYWORDS):
             score += 0.1
-        if any(keyword in snippet.lower() for keyword in ("syntax", "api", "usage")):
+        snippet_lower = snippet.lower()
+        if any(keyword in snippet_lower for keyword in _SNIPPET_KEYWORDS):
             score += 0.1
         return min(score, 0.99)
 
-    def _search(self, query: str, limit: int) -> List[SiteCandidate]:
+    def _search(
+        self,
+        query: str,
+        limit: int,
+        cache_key: Tuple[str, int],
+    ) -> List[SiteCandidate]:
         candidates: List[SiteCandidate] = []
-        with DDGS() as ddgs:
-            for idx, result in enumerate(ddgs.text(query, max_results=limit * 2)):
-                url = result.get("href") or result.get("url")
-                title = result.get("title", "")
-                snippet = result.get("body", "")
-                if not url:
-                    continue
-                hostname = urlparse(url).hostname or ""
-                if self._is_excluded(hostname):
-                    continue
-                if not self._matches_patterns(hostname) and len(candidates) >= limit:
-                    continue
-                candidate = SiteCandidate(
-                    title=title,
-                    url=url,
-                    snippet=snippet,
-                    confidence=self._score_result(url, title, snippet),
-                )
-                candidates.append(candidate)
-                if len(candidates) >= limit:
-                    break
+        for result in self._text_search(query, max_results=limit * 2):
+            url = result.get("href") or result.get("url")
+            title = result.get("title", "")
+            snippet = result.get("body", "")
+            if not url:
+                continue
+            hostname = _fast_host(url)
+            if self._is_excluded(hostname):
+                continue
+            host_matches = self._matches_patterns(hostname)
+            if not host_matches and len(candidates) >= limit:
+                continue
+            candidate = SiteCandidate(
+                title=title,
+                url=url,
+                snippet=snippet,
+                confidence=self._score_result(host_matches, title, snippet),
+            )
+            candidates.append(candidate)
+            if len(candidates) >= limit:
+                break
+
+        if candidates:  # Do not pin a transient empty result
+            self._set_cached_search(cache_key, candidates)
         return candidates
 
     async def identify(self, query: str, limit: int = 5, metadata: Optional[Dict[str, str]] = None) -> List[SiteCandidate]:
         """Identify candidate documentation sites using DuckDuckGo search."""
 
-        enriched_query = query
-        if metadata and metadata.get("language"):
-            enriched_query += f" {metadata['language']}"
-        enriched_query += " documentation"
+        enriched_query = _enrich(query, metadata.get("language") if metadata else None)
+
+        # Cache hits are answered on the loop without waiting for a search thread
+        cache_key = (self._normalize_query(enriched_query), limit)
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            return cached
 
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._search, enriched_query, limit)
+        return await loop.run_in_executor(
+            self._get_executor(), self._search, enriched_query, limit, cache_key
+        )
@@ -2,22 +2,124 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
 import logging
+import random
 import re
+import sys
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Pattern, Set, Tuple
+
+import numpy as np
 
 try:  # Optional dependency for AI-powered extraction
     from openai import OpenAI
 except ImportError:  # pragma: no cover - optional runtime dependency
     OpenAI = None  # type: ignore
 
+try:  # Optional dependency for faster JSON parsing
+    import orjson
+except ImportError:  # pragma: no cover - optional runtime dependency
+    orjson = None  # type: ignore
+
+try:  # Optional dependency for token-accurate prompt truncation
+    import tiktoken
+except ImportError:  # pragma: no cover - optional runtime dependency
+    tiktoken = None  # type: ignore
+
 from ..settings import Config
 from ..web_scraper import ScrapedPage
 
 LOGGER = logging.getLogger(__name__)
 
+# How long AI extraction requests wait for other pages to share one prompt
+AI_BATCH_WINDOW = 0.05
+# Completion tokens reserved for each page's terms; batches are packed so
+# they fit within the configured ai.max_tokens
+AI_COMPLETION_TOKENS_PER_PAGE = 1000
+
+# Retries for rate-limited (429) or failed (5xx, connection) LLM requests,
+# with exponential backoff starting at AI_RETRY_BASE_DELAY seconds
+AI_MAX_RETRIES = 3
+AI_RETRY_BASE_DELAY = 1.0
+
+# Rough characters per token, used when tiktoken is unavailable and to bound
+# how much text is tokenized before trimming
+CHARS_PER_TOKEN = 4
+# Smallest per-page budget tried after the model reports a context overflow
+AI_MIN_PROMPT_TOKENS = 64
+
+# Words too common to be technical terms
+_COMMON_WORDS = frozenset({
+    "the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by",
+    "this", "that", "these", "those", "is", "are", "was", "were", "be", "been",
+    "have", "has", "had", "do", "does", "did", "will", "would", "could", "should",
+    "can", "may", "might", "must", "shall", "use", "used", "using", "example",
+    "note", "important", "see", "also", "more", "like", "just", "only", "very"
+})
+
+# Headings too generic to be concepts
+_GENERIC_HEADINGS = frozenset({
+    "introduction", "overview", "summary", "contents", "index", "see also",
+    "references", "links", "related", "more information", "getting started",
+    "installation", "setup", "configuration", "usage", "examples", "api reference"
+})
+
+# Rejects a word that is (case-insensitively) a common word, so the
+# technical term patterns never yield one
+_NOT_COMMON = r'(?!(?i:' + '|'.join(map(re.escape, sorted(_COMMON_WORDS))) + r')\b)'
+
+# Heuristic patterns. Possessive quantifiers (``++``, ``*+``) stop the
+# engine from backtracking into runs that can never end at a valid boundary;
+# they match exactly what the plain greedy forms would.
+
+# Technical term shapes (capitalized words, camelCase, etc.). Each matches a
+# whole word and no word has two shapes, so one alternation finds exactly the
+# matches the separate patterns would; the named group tells them apart.
+_TECHNICAL_TERM_KINDS = ("pascal", "camel", "snake", "acronym")
+_TECHNICAL_TERM_RE = re.compile(
+    r'\b' + _NOT_COMMON + r'(?:'
+    r'(?P<pascal>[A-Z][a-z]++(?:[A-Z][a-z]++)*+\b)'  # PascalCase
+    r'|(?P<camel>[a-z]++[A-Z][a-zA-Z]*+\b)'          # camelCase
+    r'|(?P<snake>[a-z_]{2,}+\b)'                     # snake_case
+    r'|(?P<acronym>[A-Z]{2,}+\b)'                    # Acronyms
+    r')'
+)
+
+_CODE_BLOCK_RE = re.compile(r'```[a-zA-Z0-9_+-]*+\n([\s\S]*?)```')
+# The name lands in the group named after the entity type it defines
+_PY_DEF_RE = re.compile(
+    r'(?:async )?def\s++(?P<function>[a-zA-Z_][a-zA-Z0-9_]*+)'
+    r'|class\s++(?P<class>[a-zA-Z_][a-zA-Z0-9_]*+)'
+)
+_JS_DEF_RE = re.compile(r'(?:function|class|const|let|var)\s++([a-zA-Z_$][a-zA-Z0-9_$]*+)')
+# Whitespace after the hashes must stay on the heading's own line
+_HEADING_RE = re.compile(r'^#{1,4}+[^\S\n]+(.+)$', re.MULTILINE)
+_EMPHASIS_RE = re.compile(r'\*\*([^*]++)\*\*')
+# Acronym definition patterns: "API (Application Programming Interface)"
+_ACRONYM_DEF_RE = re.compile(r'\b([A-Z]{2,}+)\s*+\(([^)]++)\)')
+
+
+# Definition patterns matched right after a term: "Term: ...", "Term is...",
+# "Term refers to...", tried in this order of preference
+_DEFINITION_TAIL_RES = (
+    re.compile(r'\s*[:\-\—]\s*([^.!?]+)', re.IGNORECASE),
+    re.compile(r'\s+is\s+([^.!?]+)', re.IGNORECASE),
+    re.compile(r'\s+refers\s+to\s+([^.!?]+)', re.IGNORECASE),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _definition_patterns(term: str) -> Tuple[Pattern[str], ...]:
+    """Compile the definition patterns for a term; terms recur across pages."""
+    escaped = re.escape(term)
+    return tuple(
+        re.compile(escaped + tail.pattern, re.IGNORECASE) for tail in _DEFINITION_TAIL_RES
+    )
+
 
 class TermType(Enum):
     """Types of terminology that can be extracted."""
@@ -32,6 +134,21 @@ class TermType(Enum):
     DOMAIN_SPECIFIC = auto()
 
 
+# Python entity kind (named group in _PY_DEF_RE) -> term type
+_PY_ENTITY_TYPES = {"function": TermType.FUNCTION_NAME, "class": TermType.CLASS_NAME}
+
+# Ranking boost per term type, indexed by TermType value
+_TYPE_BOOST = np.zeros(max(t.value for t in TermType) + 1)
+for _term_type, _boost in (
+    (TermType.FUNCTION_NAME, 0.2),
+    (TermType.CLASS_NAME, 0.2),
+    (TermType.ACRONYM, 0.15),
+    (TermType.TECHNICAL_TERM, 0.1),
+    (TermType.CONCEPT, 0.05),
+):
+    _TYPE_BOOST[_term_type.value] = _boost
+
+
 @dataclass
 class ExtractedTerm:
     """A single extracted term with metadata."""
@@ -45,14 +162,42 @@ class ExtractedTerm:
     frequency: int = 1
     metadata: Dict[str, Any] = field(default_factory=dict)
     related_terms: List[str] = field(default_factory=list)
+    # Normalized forms used by every scoring pass, derived once from term/term_type
+    term_lower: str = field(init=False, repr=False, compare=False)
+    type_name: str = field(init=False, repr=False, compare=False)
+    word_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # The same identifiers recur across pages and terms outlive the page
+        # in the index and knowledge graph; share one string per spelling
+        if isinstance(self.term, str):
+            self.term = sys.intern(self.term)
+        self.term_lower = str(self.term).lower()
+        self.type_name = self.term_type.name
+        self.word_set = frozenset(self.term_lower.split())
     
     @property
     def id(self) -> str:
         """Generate a unique identifier for this term."""
-        term_slug = re.sub(r"[^a-z0-9]", "_", self.term.lower())[:20]
+        term_slug = re.sub(r"[^a-z0-9]", "_", self.term_lower)[:20]
         return f"term_{term_slug}"
 
 
+@functools.lru_cache(maxsize=8)
+def _load_tokenizer(model: str) -> Any:
+    """Tokenizer for the model's prompts, or None if tiktoken is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Model unknown to this tiktoken release; use the common encoding
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as exc:  # pragma: no cover - encoding files are downloaded lazily
+        LOGGER.warning("Failed to load tokenizer for %s: %s", model, exc)
+        return None
+
+
 class TerminologyExtractor:
     """Extracts important terminology from documentation using AI and heuristics."""
     
@@ -60,6 +205,27 @@ class TerminologyExtractor:
         self.config = config
         self.settings = config.terminology
         self._llm_client = self._init_llm_client()
+        # Pages waiting to be sent to the LLM together in one prompt
+        self._ai_pending: List[Tuple[ScrapedPage, asyncio.Future[List[ExtractedTerm]]]] = []
+        self._ai_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._ai_tasks: Set[asyncio.Task[None]] = set()
+        # Bounds LLM requests in flight across all pages
+        self._ai_semaphore = asyncio.Semaphore(max(1, self.settings.ai_concurrency))
+        self._tokenizer = _load_tokenizer(config.ai.model) if self._llm_client else None
+    
+    async def close(self) -> None:
+        """Cancel pending AI batches; waiting extractions return no AI terms."""
+        if self._ai_flush_handle is not None:
+            self._ai_flush_handle.cancel()
+            self._ai_flush_handle = None
+        pending, self._ai_pending = self._ai_pending, []
+        for _, future in pending:
+            if not future.done():
+                future.set_result([])
+        tasks = list(self._ai_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         
     def _init_llm_client(self):  # pragma: no cover - runtime integration
         """Initialize OpenAI client for AI-powered extraction."""
@@ -73,52 +239,79 @@ class TerminologyExtractor:
             LOGGER.warning("Failed to initialize OpenAI client: %s", exc)
             return None
     
+    async def extract_from_pages(self, pages: List[ScrapedPage]) -> List[List[ExtractedTerm]]:
+        """Extract terminology from several pages concurrently, in page order."""
+        return list(await asyncio.gather(*(self.extract_from_page(page) for page in pages)))
+    
     async def extract_from_page(self, page: ScrapedPage) -> List[ExtractedTerm]:
         """Extract terminology from a single documentation page."""
-        terms: List[ExtractedTerm] = []
+        # Terms keyed by lowercased text; repeats are merged as they are found
+        term_map: Dict[str, ExtractedTerm] = {}
         
         # Extract using heuristics
-        terms.extend(self._extract_technical_terms(page))
-        terms.extend(self._extract_code_entities(page))
-        terms.extend(self._extract_concepts(page))
-        terms.extend(self._extract_acronyms(page))
+        self._extract_technical_terms(page, term_map)
+        self._extract_code_entities(page, term_map)
+        self._extract_concepts(page, term_map)
+        self._extract_acronyms(page, term_map)
         
         # Enhance with AI if available
         if self._llm_client:
             ai_terms = await self._extract_with_ai(page)
-            terms.extend(ai_terms)
-        
-        # Deduplicate and rank
-        terms = self._deduplicate_terms(terms)
-        terms = self._rank_terms(terms)
+            for term in ai_terms:
+                key = term.term_lower
+                if not self._merge_term(term_map, key, term.confidence, term.definition, term.metadata):
+                    term.frequency = 1
+                    term_map[key] = term
         
-        # Limit to configured maximum
-        max_terms = self.settings.max_terms_per_page
-        if len(terms) > max_terms:
-            terms = terms[:max_terms]
+        # Rank, keeping only the configured maximum
+        terms = self._rank_terms(list(term_map.values()), self.settings.max_terms_per_page)
         
         LOGGER.debug("Extracted %d terms from %s", len(terms), page.url)
         return terms
     
-    def _extract_technical_terms(self, page: ScrapedPage) -> List[ExtractedTerm]:
+    @staticmethod
+    def _merge_term(
+        term_map: Dict[str, ExtractedTerm],
+        key: str,
+        confidence: float,
+        definition: str,
+        metadata: Dict[str, Any],
+    ) -> bool:
+        """Merge a repeated occurrence into the term already stored under key.
+        
+        Returns False, leaving term_map untouched, when the key is new.
+        """
+        existing = term_map.get(key)
+        if existing is None:
+            return False
+        # Merge information, keeping higher confidence
+        if confidence > existing.confidence:
+            existing.confidence = confidence
+            existing.definition = definition or existing.definition
+        existing.frequency += 1
+        # Merge metadata
+        existing.metadata.update(metadata)
+        return True
+    
+    def _extract_technical_terms(self, page: ScrapedPage, term_map: Dict[str, ExtractedTerm]) -> None:
         """Extract technical terms using patterns and heuristics."""
-        terms: List[ExtractedTerm] = []
         content = page.markdown or page.text
         
-        # Technical term patterns (capitalized words, camelCase, etc.)
-        patterns = [
-            r'\b[A-Z][a-z]+(?:[A-Z][a-z]+)*\b',  # PascalCase
-            r'\b[a-z]+[A-Z][a-zA-Z]*\b',          # camelCase
-            r'\b[a-z_]+[a-z_]+\b',                # snake_case
-            r'\b[A-Z]{2,}\b',                     # Acronyms
-        ]
+        # Scan once, then take matches grouped by shape in the order the
+        # shapes were historically scanned; the first occurrence is kept
+        by_kind: Dict[str, List[re.Match[str]]] = {kind: [] for kind in _TECHNICAL_TERM_KINDS}
+        for match in _TECHNICAL_TERM_RE.finditer(content):
+            by_kind[match.lastgroup].append(match)
         
-        for pattern in patterns:
-            for match in re.finditer(pattern, content):
+        for kind in _TECHNICAL_TERM_KINDS:
+            for match in by_kind[kind]:
                 term = match.group(0)
+                key = term.lower()
                 
-                # Skip common words
-                if self._is_common_word(term):
+                # These are the first terms added, so a repeat always meets an
+                # earlier technical term of equal confidence and its definition
+                # is never taken; skip computing context and definition for it
+                if self._merge_term(term_map, key, 0.7, "", {"extraction_method": "heuristic"}):
                     continue
                 
                 # Extract context around the term
@@ -129,7 +322,7 @@ class TerminologyExtractor:
                 # Try to extract definition
                 definition = self._extract_definition(term, context)
                 
-                terms.append(ExtractedTerm(
+                term_map[key] = ExtractedTerm(
                     term=term,
                     term_type=TermType.TECHNICAL_TERM,
                     definition=definition,
@@ -137,132 +330,215 @@ class TerminologyExtractor:
                     source_url=page.url,
                     confidence=0.7,
                     metadata={"extraction_method": "heuristic"}
-                ))
-        
-        return terms
+                )
     
-    def _extract_code_entities(self, page: ScrapedPage) -> List[ExtractedTerm]:
+    def _extract_code_entities(self, page: ScrapedPage, term_map: Dict[str, ExtractedTerm]) -> None:
         """Extract function, class, and method names from code blocks."""
-        terms: List[ExtractedTerm] = []
         content = page.markdown or page.text
         
         # Find code blocks
-        code_pattern = r'```(?:[a-zA-Z0-9_+-]*)\n([\s\S]*?)```'
-        for match in re.finditer(code_pattern, content):
+        for match in _CODE_BLOCK_RE.finditer(content):
             code = match.group(1)
             
             # Python functions and classes
-            func_matches = re.finditer(r'(?:def|async def|class)\s+([a-zA-Z_][a-zA-Z0-9_]*)', code)
+            func_matches = _PY_DEF_RE.finditer(code)
             for func_match in func_matches:
-                name = func_match.group(1)
-                entity_type = "class" if func_match.group(0).startswith("class") else "function"
+                entity_type = func_match.lastgroup
+                name = func_match.group(entity_type)
+                key = name.lower()
+                metadata = {"language": "python", "entity_type": entity_type}
+                definition = f"{entity_type} definition"
                 
-                terms.append(ExtractedTerm(
+                if self._merge_term(term_map, key, 0.9, definition, metadata):
+                    continue
+                term_map[key] = ExtractedTerm(
                     term=name,
-                    term_type=TermType.FUNCTION_NAME if "func" in entity_type else TermType.CLASS_NAME,
-                    definition=f"{entity_type} definition",
+                    term_type=_PY_ENTITY_TYPES[entity_type],
+                    definition=definition,
                     context=code[max(0, func_match.start()-50):func_match.end()+50],
                     source_url=page.url,
                     confidence=0.9,
-                    metadata={"language": "python", "entity_type": entity_type}
-                ))
+                    metadata=metadata
+                )
             
             # JavaScript/TypeScript functions and classes
-            js_matches = re.finditer(r'(?:function|class|const|let|var)\s+([a-zA-Z_$][a-zA-Z0-9_$]*)', code)
+            js_matches = _JS_DEF_RE.finditer(code)
             for js_match in js_matches:
                 name = js_match.group(1)
-                terms.append(ExtractedTerm(
+                key = name.lower()
+                metadata = {"language": "javascript"}
+                
+                if self._merge_term(term_map, key, 0.9, "JavaScript/TypeScript entity", metadata):
+                    continue
+                term_map[key] = ExtractedTerm(
                     term=name,
                     term_type=TermType.FUNCTION_NAME,
                     definition="JavaScript/TypeScript entity",
                     context=code[max(0, js_match.start()-50):js_match.end()+50],
                     source_url=page.url,
                     confidence=0.9,
-                    metadata={"language": "javascript"}
-                ))
-        
-        return terms
+                    metadata=metadata
+                )
     
-    def _extract_concepts(self, page: ScrapedPage) -> List[ExtractedTerm]:
+    def _extract_concepts(self, page: ScrapedPage, term_map: Dict[str, ExtractedTerm]) -> None:
         """Extract conceptual terms from headings and emphasized text."""
-        terms: List[ExtractedTerm] = []
         content = page.markdown or page.text
         
-        # Heading patterns
-        heading_pattern = r'^#{1,4}\s+(.+)$'
-        lines = content.split('\n')
-        
-        for line in lines:
-            match = re.match(heading_pattern, line)
-            if match:
-                concept = match.group(1).strip()
-                
-                # Skip generic headings
-                if self._is_generic_heading(concept):
-                    continue
-                
-                terms.append(ExtractedTerm(
-                    term=concept,
-                    term_type=TermType.CONCEPT,
-                    definition=f"Concept: {concept}",
-                    context=line,
-                    source_url=page.url,
-                    confidence=0.8,
-                    metadata={"extraction_method": "heading"}
-                ))
+        # Headings; each match spans exactly one line
+        for match in _HEADING_RE.finditer(content):
+            concept = match.group(1).strip()
+            
+            # Skip generic headings
+            if self._is_generic_heading(concept):
+                continue
+            
+            key = concept.lower()
+            metadata = {"extraction_method": "heading"}
+            definition = f"Concept: {concept}"
+            if self._merge_term(term_map, key, 0.8, definition, metadata):
+                continue
+            term_map[key] = ExtractedTerm(
+                term=concept,
+                term_type=TermType.CONCEPT,
+                definition=definition,
+                context=match.group(0),
+                source_url=page.url,
+                confidence=0.8,
+                metadata=metadata
+            )
         
         # Bold/emphasized terms
-        emphasis_pattern = r'\*\*([^*]+)\*\*'
-        for match in re.finditer(emphasis_pattern, content):
+        for match in _EMPHASIS_RE.finditer(content):
             term = match.group(1).strip()
             if len(term) > 2 and not self._is_common_word(term):
-                terms.append(ExtractedTerm(
+                key = term.lower()
+                metadata = {"extraction_method": "emphasis"}
+                if self._merge_term(term_map, key, 0.6, "Emphasized term", metadata):
+                    continue
+                term_map[key] = ExtractedTerm(
                     term=term,
                     term_type=TermType.CONCEPT,
-                    definition=f"Emphasized term",
+                    definition="Emphasized term",
                     context=content[max(0, match.start()-50):match.end()+50],
                     source_url=page.url,
                     confidence=0.6,
-                    metadata={"extraction_method": "emphasis"}
-                ))
-        
-        return terms
+                    metadata=metadata
+                )
     
-    def _extract_acronyms(self, page: ScrapedPage) -> List[ExtractedTerm]:
+    def _extract_acronyms(self, page: ScrapedPage, term_map: Dict[str, ExtractedTerm]) -> None:
         """Extract acronyms and their definitions."""
-        terms: List[ExtractedTerm] = []
         content = page.markdown or page.text
         
-        # Acronym definition patterns: "API (Application Programming Interface)"
-        acronym_pattern = r'\b([A-Z]{2,})\s*\(([^)]+)\)'
-        for match in re.finditer(acronym_pattern, content):
+        for match in _ACRONYM_DEF_RE.finditer(content):
             acronym = match.group(1)
             definition = match.group(2)
+            key = acronym.lower()
+            metadata = {"full_form": definition}
             
-            terms.append(ExtractedTerm(
+            if self._merge_term(term_map, key, 0.95, definition, metadata):
+                continue
+            term_map[key] = ExtractedTerm(
                 term=acronym,
                 term_type=TermType.ACRONYM,
                 definition=definition,
                 context=match.group(0),
                 source_url=page.url,
                 confidence=0.95,
-                metadata={"full_form": definition}
-            ))
-        
-        return terms
+                metadata=metadata
+            )
     
     async def _extract_with_ai(self, page: ScrapedPage) -> List[ExtractedTerm]:
-        """Use AI to extract domain-specific terminology."""
+        """Use AI to extract domain-specific terminology.
+        
+        Pages extracted concurrently are packed into shared prompts of up to
+        ``ai_pages_per_request`` pages, so loading a site costs a few LLM
+        round-trips rather than one per page.
+        """
         if not self._llm_client:
             return []
         
-        content = (page.markdown or page.text)[:2000]  # Limit content length
+        batch_size = min(
+            self.settings.ai_pages_per_request,
+            self.config.ai.max_tokens // AI_COMPLETION_TOKENS_PER_PAGE,
+        )
+        if batch_size <= 1:
+            return (await self._request_ai_terms([page]))[0]
         
-        prompt = f"""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[List[ExtractedTerm]] = loop.create_future()
+        self._ai_pending.append((page, future))
+        if len(self._ai_pending) >= batch_size:
+            self._flush_ai_batch()
+        elif self._ai_flush_handle is None:
+            self._ai_flush_handle = loop.call_later(AI_BATCH_WINDOW, self._flush_ai_batch)
+        return await future
+    
+    def _flush_ai_batch(self) -> None:
+        """Send the pending pages to the LLM in one request."""
+        if self._ai_flush_handle is not None:
+            self._ai_flush_handle.cancel()
+            self._ai_flush_handle = None
+        batch, self._ai_pending = self._ai_pending, []
+        if not batch:
+            return
+        
+        async def run() -> None:
+            try:
+                results = await self._request_ai_terms([page for page, _ in batch])
+                for (_, future), terms in zip(batch, results):
+                    if not future.done():
+                        future.set_result(terms)
+            finally:
+                # Cancelled or failed outside the LLM call; don't leave callers waiting
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result([])
+        
+        task = asyncio.ensure_future(run())
+        self._ai_tasks.add(task)
+        task.add_done_callback(self._ai_tasks.discard)
+    
+    def _truncate_to_tokens(self, text: str, max_tokens: int) -> str:
+        """Trim text to at most max_tokens tokens of the configured model."""
+        if self._tokenizer is None:
+            return text[:max_tokens * CHARS_PER_TOKEN]
+        # Tokens are rarely longer than a few characters, so avoid encoding
+        # the tail of very long pages that would be cut anyway
+        head = text[:max_tokens * CHARS_PER_TOKEN * 4]
+        tokens = self._tokenizer.encode(head, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return head
+        return self._tokenizer.decode(tokens[:max_tokens])
+    
+    async def _request_ai_terms(self, pages: List[ScrapedPage]) -> List[List[ExtractedTerm]]:
+        """Ask the LLM for the terms of one or more pages; one list per page."""
+        budget = self.settings.ai_prompt_tokens
+        while True:
+            contents = [
+                self._truncate_to_tokens(page.markdown or page.text, budget) for page in pages
+            ]
+            try:
+                return await self._request_ai_terms_once(pages, contents)
+            except Exception as exc:
+                if self._is_context_overflow(exc) and budget > AI_MIN_PROMPT_TOKENS:
+                    budget = max(AI_MIN_PROMPT_TOKENS, budget // 2)
+                    LOGGER.debug("AI prompt too long; retrying with %d tokens per page", budget)
+                    continue
+                LOGGER.warning("AI extraction failed: %s", exc)
+                return [[] for _ in pages]
+    
+    async def _request_ai_terms_once(
+        self,
+        pages: List[ScrapedPage],
+        contents: List[str],
+    ) -> List[List[ExtractedTerm]]:
+        """Send one extraction prompt for the given page contents."""
+        if len(pages) == 1:
+            prompt = f"""
         Extract important technical terms, concepts, and domain-specific terminology from this documentation content.
         
         Content:
-        {content}
+        {contents[0]}
         
         Return a JSON array of terms with:
         - term: the exact term
@@ -278,116 +554,170 @@ class TerminologyExtractor:
         
         Limit to the 10 most important terms.
         """
-        
-        try:
-            response = self._llm_client.chat.completions.create(
-                model=self.config.ai.model,
-                temperature=0.1,
-                max_tokens=1000,
-                messages=[
-                    {"role": "system", "content": "You are a technical documentation analyst."},
-                    {"role": "user", "content": prompt}
-                ]
+        else:
+            sections = "\n".join(
+                f"=== PAGE {index} ===\n{content}"
+                for index, content in enumerate(contents, start=1)
             )
-            
-            import json
-            ai_data = json.loads(response.choices[0].message.content)
-            
-            terms: List[ExtractedTerm] = []
-            for item in ai_data:
-                term_type_map = {
-                    "technical_term": TermType.TECHNICAL_TERM,
-                    "concept": TermType.CONCEPT,
-                    "acronym": TermType.ACRONYM,
-                    "domain_specific": TermType.DOMAIN_SPECIFIC
-                }
-                
-                terms.append(ExtractedTerm(
-                    term=item["term"],
-                    term_type=term_type_map.get(item["type"], TermType.TECHNICAL_TERM),
-                    definition=item.get("definition", ""),
-                    context=content[:200],
-                    source_url=page.url,
-                    confidence=item.get("confidence", 0.8),
-                    metadata={"extraction_method": "ai"}
-                ))
-            
-            return terms
-            
-        except Exception as exc:
-            LOGGER.warning("AI extraction failed: %s", exc)
-            return []
+            prompt = f"""
+        Extract important technical terms, concepts, and domain-specific terminology from each of the {len(pages)} documentation pages below.
+        
+        {sections}
+        
+        Return a JSON array with exactly {len(pages)} elements, one per page in order.
+        Each element is a JSON array of terms with:
+        - term: the exact term
+        - type: technical_term, concept, acronym, or domain_specific
+        - definition: brief definition or explanation
+        - confidence: 0.0-1.0 confidence score
+        
+        Focus on terms that are:
+        - Specific to this domain/technology
+        - Important for understanding the documentation
+        - Likely to be searched for by users
+        - Not common English words
+        
+        Limit to the 10 most important terms per page.
+        """
+        
+        response = await self._complete_with_retry(
+            model=self.config.ai.model,
+            temperature=0.1,
+            max_tokens=min(AI_COMPLETION_TOKENS_PER_PAGE * len(pages), self.config.ai.max_tokens),
+            messages=[
+                {"role": "system", "content": "You are a technical documentation analyst."},
+                {"role": "user", "content": prompt}
+            ]
+        )
+        
+        raw = response.choices[0].message.content
+        ai_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        per_page = [ai_data] if len(pages) == 1 else ai_data
+        if not isinstance(per_page, list) or len(per_page) != len(pages):
+            raise ValueError(f"expected terms for {len(pages)} pages")
+        
+        return [
+            self._terms_from_ai_items(items, page, content)
+            for items, page, content in zip(per_page, pages, contents)
+        ]
     
-    def _deduplicate_terms(self, terms: List[ExtractedTerm]) -> List[ExtractedTerm]:
-        """Remove duplicate terms and merge their information."""
-        term_map: Dict[str, ExtractedTerm] = {}
+    async def _complete_with_retry(self, **request: Any) -> Any:
+        """Run a chat completion off the event loop, retrying transient errors."""
+        for attempt in range(AI_MAX_RETRIES + 1):
+            try:
+                async with self._ai_semaphore:
+                    return await asyncio.to_thread(
+                        self._llm_client.chat.completions.create, **request
+                    )
+            except Exception as exc:
+                if attempt == AI_MAX_RETRIES or not self._is_retryable(exc):
+                    raise
+                delay = AI_RETRY_BASE_DELAY * (2 ** attempt) * (1 + random.random())
+                LOGGER.debug("AI request failed (%s); retrying in %.1fs", exc, delay)
+                await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _is_context_overflow(exc: Exception) -> bool:
+        """Whether the LLM rejected the prompt for exceeding its context window."""
+        return getattr(exc, "code", None) == "context_length_exceeded"
+    
+    @staticmethod
+    def _is_retryable(exc: Exception) -> bool:
+        """Whether an OpenAI client error is worth retrying."""
+        status = getattr(exc, "status_code", None)
+        if status is not None:
+            return status == 429 or status >= 500
+        # Connection errors and timeouts carry no status code
+        return type(exc).__name__ in ("APIConnectionError", "APITimeoutError")
+    
+    @staticmethod
+    def _terms_from_ai_items(
+        items: List[Dict[str, Any]],
+        page: ScrapedPage,
+        content: str,
+    ) -> List[ExtractedTerm]:
+        """Convert the LLM's JSON term objects for a page into terms."""
+        term_type_map = {
+            "technical_term": TermType.TECHNICAL_TERM,
+            "concept": TermType.CONCEPT,
+            "acronym": TermType.ACRONYM,
+            "domain_specific": TermType.DOMAIN_SPECIFIC
+        }
         
-        for term in terms:
-            key = term.term.lower()
-            if key in term_map:
-                existing = term_map[key]
-                # Merge information, keeping higher confidence
-                if term.confidence > existing.confidence:
-                    existing.confidence = term.confidence
-                    existing.definition = term.definition or existing.definition
-                existing.frequency += 1
-                # Merge metadata
-                existing.metadata.update(term.metadata)
-            else:
-                term.frequency = 1
-                term_map[key] = term
-        
-        return list(term_map.values())
+        terms: List[ExtractedTerm] = []
+        for item in items:
+            terms.append(ExtractedTerm(
+                term=item["term"],
+                term_type=term_type_map.get(item["type"], TermType.TECHNICAL_TERM),
+                definition=item.get("definition", ""),
+                context=content[:200],
+                source_url=page.url,
+                confidence=item.get("confidence", 0.8),
+                metadata={"extraction_method": "ai"}
+            ))
+        return terms
     
-    def _rank_terms(self, terms: List[ExtractedTerm]) -> List[ExtractedTerm]:
-        """Rank terms by importance and confidence."""
-        def score_term(term: ExtractedTerm) -> float:
-            base_score = term.confidence
-            frequency_boost = min(term.frequency * 0.1, 0.3)
-            type_boost = {
-                TermType.FUNCTION_NAME: 0.2,
-                TermType.CLASS_NAME: 0.2,
-                TermType.ACRONYM: 0.15,
-                TermType.TECHNICAL_TERM: 0.1,
-                TermType.CONCEPT: 0.05,
-            }.get(term.term_type, 0.0)
-            
-            return base_score + frequency_boost + type_boost
+    def _rank_terms(self, terms: List[ExtractedTerm], limit: Optional[int] = None) -> List[ExtractedTerm]:
+        """Rank terms by importance and confidence, returning at most limit terms."""
+        count = len(terms)
+        if limit is None or limit > count:
+            limit = count
+        if limit <= 0:
+            return []
+        if count < 2:
+            return list(terms)
+        
+        # Score all terms at once from per-field arrays
+        confidence = np.fromiter((t.confidence for t in terms), dtype=np.float64, count=count)
+        frequency = np.fromiter((t.frequency for t in terms), dtype=np.float64, count=count)
+        type_code = np.fromiter((t.term_type.value for t in terms), dtype=np.intp, count=count)
+        scores = confidence + np.minimum(frequency * 0.1, 0.3) + _TYPE_BOOST[type_code]
         
-        return sorted(terms, key=score_term, reverse=True)
+        neg_scores = -scores
+        if limit < count:
+            # Only sort the terms scoring at least the limit-th best score;
+            # ties at the cut-off are all kept so the stable order decides
+            cutoff = np.partition(neg_scores, limit - 1)[limit - 1]
+            candidates = np.flatnonzero(neg_scores <= cutoff)
+        else:
+            candidates = np.arange(count)
+        
+        # Stable so equally scored terms keep their extraction order
+        order = candidates[np.argsort(neg_scores[candidates], kind="stable")]
+        return [terms[i] for i in order[:limit]]
     
     def _is_common_word(self, word: str) -> bool:
         """Check if a word is too common to be a technical term."""
-        common_words = {
-            "the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by",
-            "this", "that", "these", "those", "is", "are", "was", "were", "be", "been",
-            "have", "has", "had", "do", "does", "did", "will", "would", "could", "should",
-            "can", "may", "might", "must", "shall", "use", "used", "using", "example",
-            "note", "important", "see", "also", "more", "like", "just", "only", "very"
-        }
-        return word.lower() in common_words
+        return word.lower() in _COMMON_WORDS
     
     def _is_generic_heading(self, heading: str) -> bool:
         """Check if a heading is too generic to be a concept."""
-        generic_headings = {
-            "introduction", "overview", "summary", "contents", "index", "see also",
-            "references", "links", "related", "more information", "getting started",
-            "installation", "setup", "configuration", "usage", "examples", "api reference"
-        }
-        return heading.lower() in generic_headings
+        return heading.lower() in _GENERIC_HEADINGS
     
     def _extract_definition(self, term: str, context: str) -> str:
         """Try to extract a definition for a term from its context."""
-        # Look for definition patterns: "Term is...", "Term: ...", "Term - ..."
-        definition_patterns = [
-            rf'{re.escape(term)}\s*[:\-\—]\s*([^.!?]+)',
-            rf'{re.escape(term)}\s+is\s+([^.!?]+)',
-            rf'{re.escape(term)}\s+refers\s+to\s+([^.!?]+)',
-        ]
+        context_lower = context.lower()
+        term_lower = term.lower()
+        if len(context_lower) != len(context) or len(term_lower) != len(term):
+            # Lowercasing shifted offsets; fall back to per-term patterns
+            for pattern in _definition_patterns(term):
+                match = pattern.search(context)
+                if match:
+                    return match.group(1).strip()
+            return ""
+        
+        # Locate the term with plain string search, then match the shared
+        # precompiled tails right after each occurrence
+        ends = []
+        idx = context_lower.find(term_lower)
+        while idx >= 0:
+            ends.append(idx + len(term))
+            idx = context_lower.find(term_lower, idx + 1)
         
-        for pattern in definition_patterns:
-            match = re.search(pattern, context, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+        for tail in _DEFINITION_TAIL_RES:
+            for end in ends:
+                match = tail.match(context, end)
+                if match:
+                    return match.group(1).strip()
         
         return ""
@@ -2,20 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
+import json
 import logging
+import os
+import re
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import aiohttp
 
+try:  # Optional dependency for faster JSON encoding/parsing
+    import orjson
+except ImportError:  # pragma: no cover - optional runtime dependency
+    orjson = None  # type: ignore
+
 from ..settings import Config
 from .extractor import ExtractedTerm
 
 LOGGER = logging.getLogger(__name__)
 
+# Per-collection token index used to narrow local (non-Zoekt) search
+LOCAL_INDEX_FILE = "_local_index.json"
+# Changed indexes are saved together once this many seconds have passed
+# (and on close), rather than after every indexed page
+LOCAL_INDEX_SAVE_DELAY = 5.0
+_TOKEN_RE = re.compile(r"\w+")
+_TERM_TYPE_RE = re.compile(r'"term_type": "([^"]+)"')
+# Metadata block written by _build_term_file_content
+_JSON_BLOCK_RE = re.compile(r'```json\n(.*?)\n```', re.DOTALL)
+
+
+@functools.lru_cache(maxsize=4096)
+def _url_dir_name(url: str) -> str:
+    """Directory name for a source URL's term files."""
+    # Kept as a SHA-256 prefix so existing collections map to the same paths
+    return hashlib.sha256(url.encode()).hexdigest()[:8]
+
 
 @dataclass
 class TermIndex:
@@ -26,6 +53,82 @@ class TermIndex:
     metadata: Dict[str, Any]
 
 
+class _LocalTermIndex:
+    """Lowercased word tokens and term type of each term file in a collection.
+    
+    A file can only contain the query as a substring if every word token of
+    the query occurs inside one of the file's tokens, so the postings give a
+    candidate set that is checked against the file text afterwards.
+    """
+    
+    def __init__(self) -> None:
+        self.file_tokens: Dict[str, List[str]] = {}
+        self.file_types: Dict[str, Optional[str]] = {}
+        self.postings: Dict[str, Set[str]] = {}
+    
+    def add(self, rel_path: str, content: str) -> None:
+        self.remove(rel_path)
+        tokens = sorted(set(_TOKEN_RE.findall(content.lower())))
+        type_match = _TERM_TYPE_RE.search(content)
+        self._insert(rel_path, tokens, type_match.group(1) if type_match else None)
+    
+    def _insert(self, rel_path: str, tokens: List[str], term_type: Optional[str]) -> None:
+        self.file_tokens[rel_path] = tokens
+        self.file_types[rel_path] = term_type
+        for token in tokens:
+            self.postings.setdefault(token, set()).add(rel_path)
+    
+    def remove(self, rel_path: str) -> None:
+        self.file_types.pop(rel_path, None)
+        for token in self.file_tokens.pop(rel_path, ()):
+            files = self.postings.get(token)
+            if files is not None:
+                files.discard(rel_path)
+                if not files:
+                    del self.postings[token]
+    
+    def candidates(self, query_lower: str, term_type: Optional[str] = None) -> Set[str]:
+        """Files of the given term type that may contain the query."""
+        if term_type:
+            result: Optional[Set[str]] = {
+                rel_path for rel_path, file_type in self.file_types.items()
+                if file_type == term_type
+            }
+        else:
+            result = None
+        
+        query_tokens = set(_TOKEN_RE.findall(query_lower))
+        if not query_tokens:
+            return set(self.file_tokens) if result is None else result
+        
+        for query_token in query_tokens:
+            # Query tokens may be cut from longer words at the query's edges
+            matched: Set[str] = set()
+            for token, files in self.postings.items():
+                if query_token in token:
+                    matched |= files
+            result = matched if result is None else result & matched
+            if not result:
+                return set()
+        return result or set()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Shallow copy for serializing off the event loop.
+        
+        Token lists are replaced rather than mutated, so sharing them with
+        the live index is safe.
+        """
+        return {"files": dict(self.file_tokens), "types": dict(self.file_types)}
+    
+    @classmethod
+    def from_json(cls, raw: str) -> "_LocalTermIndex":
+        data = json.loads(raw)
+        index = cls()
+        for rel_path, tokens in data["files"].items():
+            index._insert(rel_path, tokens, data["types"].get(rel_path))
+        return index
+
+
 class TerminologyIndexer:
     """Indexes extracted terminology using Zoekt for fast search."""
     
@@ -35,10 +138,104 @@ class TerminologyIndexer:
         self.zoekt_settings = config.zoekt
         self._index_dir = Path(self.settings.index_dir).expanduser().resolve()
         self._ensure_index_dir()
+        # collection name -> token index, loaded on first local search
+        self._local_indexes: Dict[str, _LocalTermIndex] = {}
+        # Collections whose index changed since it was last saved
+        self._dirty_indexes: Set[str] = set()
+        self._save_task: Optional[asyncio.Task] = None
+        self._save_lock = asyncio.Lock()
+        self._session: Optional[aiohttp.ClientSession] = None
         
     def _ensure_index_dir(self) -> None:
         """Create index directory if it doesn't exist."""
         self._index_dir.mkdir(parents=True, exist_ok=True)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            # Shared by index triggers and searches so Zoekt connections are reused
+            connector = aiohttp.TCPConnector(limit=20, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=connector,
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        await self._flush_local_indexes()
+        if self._save_task is not None:
+            self._save_task.cancel()
+            self._save_task = None
+        if self._session and not self._session.closed:
+            await self._session.close()
+    
+    async def _get_local_index(self, collection_name: str) -> _LocalTermIndex:
+        """Return the collection's token index, loading it in a worker thread."""
+        index = self._local_indexes.get(collection_name)
+        if index is not None:
+            return index
+        
+        loaded, rebuilt = await asyncio.to_thread(
+            self._load_local_index, self._index_dir / collection_name
+        )
+        # Another caller may have finished loading while this one waited
+        index = self._local_indexes.get(collection_name)
+        if index is None:
+            index = self._local_indexes[collection_name] = loaded
+            if rebuilt:
+                self._mark_index_dirty(collection_name)
+        return index
+    
+    @staticmethod
+    def _load_local_index(collection_dir: Path) -> Tuple[_LocalTermIndex, bool]:
+        """Read a token index from disk; returns (index, rebuilt from term files)."""
+        index_file = collection_dir / LOCAL_INDEX_FILE
+        try:
+            return _LocalTermIndex.from_json(index_file.read_text(encoding="utf-8")), False
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        
+        # Missing or unreadable: index the term files already on disk
+        index = _LocalTermIndex()
+        for term_file in collection_dir.rglob("term_*.md"):
+            try:
+                index.add(
+                    str(term_file.relative_to(collection_dir)),
+                    term_file.read_text(encoding="utf-8"),
+                )
+            except Exception as exc:
+                LOGGER.warning("Error reading term file %s: %s", term_file, exc)
+        return index, True
+    
+    def _mark_index_dirty(self, collection_name: str) -> None:
+        """Queue a collection's index for the next batched save."""
+        self._dirty_indexes.add(collection_name)
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._save_local_indexes_later())
+    
+    async def _save_local_indexes_later(self) -> None:
+        await asyncio.sleep(LOCAL_INDEX_SAVE_DELAY)
+        await self._flush_local_indexes()
+    
+    async def _flush_local_indexes(self) -> None:
+        """Save every changed index, serializing and writing in worker threads."""
+        async with self._save_lock:
+            while self._dirty_indexes:
+                collection_name = self._dirty_indexes.pop()
+                index = self._local_indexes.get(collection_name)
+                if index is None:
+                    continue
+                await asyncio.to_thread(
+                    self._save_local_index,
+                    self._index_dir / collection_name,
+                    index.snapshot(),
+                )
+    
+    @staticmethod
+    def _save_local_index(collection_dir: Path, snapshot: Dict[str, Any]) -> None:
+        try:
+            (collection_dir / LOCAL_INDEX_FILE).write_text(json.dumps(snapshot), encoding="utf-8")
+        except OSError as exc:
+            LOGGER.warning("Failed to save local term index for %s: %s", collection_dir, exc)
         
     async def index_terms(self, terms: List[ExtractedTerm], collection_name: str = "terminology") -> TermIndex:
         """Index a collection of terms for fast search."""
@@ -57,25 +254,21 @@ class TerminologyIndexer:
                 terms_by_url[term.source_url] = []
             terms_by_url[term.source_url].append(term)
         
-        # Write term files for Zoekt indexing
-        written_files = []
-        for url, url_terms in terms_by_url.items():
-            url_hash = hashlib.sha256(url.encode()).hexdigest()[:8]
-            source_dir = collection_dir / url_hash
-            source_dir.mkdir(parents=True, exist_ok=True)
-            
-            for idx, term in enumerate(url_terms):
-                file_path = source_dir / f"term_{idx}.md"
-                content = self._build_term_file_content(term)
-                file_path.write_text(content, encoding="utf-8")
-                written_files.append(str(file_path))
+        # Write term files for Zoekt indexing in one worker thread call
+        written = await asyncio.to_thread(self._write_term_files, collection_dir, terms_by_url)
+        
+        local_index = await self._get_local_index(collection_name)
+        for rel_path, content in written:
+            local_index.add(rel_path, content)
+        self._mark_index_dirty(collection_name)
+        written_files = [str(collection_dir / rel_path) for rel_path, _ in written]
         
         # Create metadata
         metadata = {
             "collection": collection_name,
             "total_terms": len(terms),
             "sources": list(terms_by_url.keys()),
-            "term_types": list(set(term.term_type.name for term in terms)),
+            "term_types": list(set(term.type_name for term in terms)),
             "files_created": len(written_files),
             "index_path": str(collection_dir),
         }
@@ -97,11 +290,30 @@ class TerminologyIndexer:
             metadata=metadata
         )
     
+    def _write_term_files(
+        self,
+        collection_dir: Path,
+        terms_by_url: Dict[str, List[ExtractedTerm]],
+    ) -> List[Tuple[str, str]]:
+        """Render and write term files, returning (relative path, content) pairs."""
+        written: List[Tuple[str, str]] = []
+        for url, url_terms in terms_by_url.items():
+            url_dir = _url_dir_name(url)
+            source_dir = collection_dir / url_dir
+            source_dir.mkdir(parents=True, exist_ok=True)
+            
+            for idx, term in enumerate(url_terms):
+                file_name = f"term_{idx}.md"
+                content = self._build_term_file_content(term)
+                (source_dir / file_name).write_text(content, encoding="utf-8")
+                written.append((str(Path(url_dir) / file_name), content))
+        return written
+    
     def _build_term_file_content(self, term: ExtractedTerm) -> str:
         """Build markdown content for a term file."""
         content = f"""# {term.term}
 
-**Type:** {term.term_type.name}  
+**Type:** {term.type_name}  
 **Confidence:** {term.confidence:.2f}  
 **Source:** {term.source_url}
 
@@ -113,13 +325,7 @@ class TerminologyIndexer:
 
 ## Metadata
 ```json
-{{
-    "term_type": "{term.term_type.name}",
-    "confidence": {term.confidence},
-    "frequency": {term.frequency},
-    "source_url": "{term.source_url}",
-    "metadata": {term.metadata}
-}}
+{self._metadata_json(term)}
 ```
 """
         if term.related_terms:
@@ -127,6 +333,20 @@ class TerminologyIndexer:
             
         return content
     
+    @staticmethod
+    def _metadata_json(term: ExtractedTerm) -> str:
+        """Serialize a term's metadata block as valid, indented JSON."""
+        block = {
+            "term_type": term.type_name,
+            "confidence": term.confidence,
+            "frequency": term.frequency,
+            "source_url": term.source_url,
+            "metadata": term.metadata,
+        }
+        if orjson is not None:
+            return orjson.dumps(block, default=str, option=orjson.OPT_INDENT_2).decode("utf-8")
+        return json.dumps(block, default=str, indent=2, ensure_ascii=False)
+    
     async def _trigger_zoekt_index(self, index_path: Path) -> None:
         """Trigger Zoekt indexing for the prepared files."""
         if not self.zoekt_settings.enabled:
@@ -138,20 +358,20 @@ class TerminologyIndexer:
             LOGGER.info("Triggering Zoekt indexing for %s", index_path)
             
             # Simulate API call to Zoekt server
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.zoekt_settings.server_url}/index"
-                data = {
-                    "path": str(index_path),
-                    "name": f"terminology_{index_path.name}",
-                    "repo_url": f"file://{index_path}"
-                }
-                
-                async with session.post(url, json=data, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        LOGGER.info("Zoekt indexing started: %s", result.get("job_id"))
-                    else:
-                        LOGGER.warning("Zoekt indexing failed: %d", response.status)
+            session = await self._get_session()
+            url = f"{self.zoekt_settings.server_url}/index"
+            data = {
+                "path": str(index_path),
+                "name": f"terminology_{index_path.name}",
+                "repo_url": f"file://{index_path}"
+            }
+            
+            async with session.post(url, json=data) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    LOGGER.info("Zoekt indexing started: %s", result.get("job_id"))
+                else:
+                    LOGGER.warning("Zoekt indexing failed: %d", response.status)
                         
         except Exception as exc:
             LOGGER.warning("Failed to trigger Zoekt indexing: %s", exc)
@@ -172,21 +392,21 @@ class TerminologyIndexer:
             # Build Zoekt query
             zoekt_query = self._build_zoekt_query(query, term_type)
             
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.zoekt_settings.server_url}/search"
-                params = {
-                    "q": zoekt_query,
-                    "limit": limit,
-                    "context": self.zoekt_settings.context_lines,
-                }
-                
-                async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return self._process_zoekt_results(result)
-                    else:
-                        LOGGER.warning("Zoekt search failed: %d", response.status)
-                        return await self._local_search(query, collection_name, limit, term_type)
+            session = await self._get_session()
+            url = f"{self.zoekt_settings.server_url}/search"
+            params = {
+                "q": zoekt_query,
+                "limit": limit,
+                "context": self.zoekt_settings.context_lines,
+            }
+            
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    return self._process_zoekt_results(result)
+                else:
+                    LOGGER.warning("Zoekt search failed: %d", response.status)
+                    return await self._local_search(query, collection_name, limit, term_type)
                         
         except Exception as exc:
             LOGGER.warning("Zoekt search failed, falling back to local search: %s", exc)
@@ -236,8 +456,13 @@ class TerminologyIndexer:
         results = []
         query_lower = query.lower()
         
-        # Search through all term files
-        for term_file in collection_dir.rglob("term_*.md"):
+        # Only read the term files the token index cannot rule out; the term
+        # type filter is applied from the index without opening any file
+        local_index = await self._get_local_index(collection_name)
+        candidates = local_index.candidates(query_lower, term_type)
+        
+        for rel_path in sorted(candidates):
+            term_file = collection_dir / rel_path
             try:
                 content = term_file.read_text(encoding="utf-8")
                 
@@ -251,10 +476,6 @@ class TerminologyIndexer:
                 if lines and query_lower in lines[0].lower():
                     score += 0.5
                 
-                # Filter by term type if specified
-                if term_type and f'"term_type": "{term_type}"' not in content:
-                    continue
-                
                 if score > 0:
                     results.append({
                         "file": str(term_file.relative_to(collection_dir)),
@@ -297,18 +518,15 @@ class TerminologyIndexer:
     
     def _extract_metadata_from_content(self, content: str) -> Dict[str, Any]:
         """Extract metadata from term file content."""
-        metadata = {}
-        
-        # Extract JSON metadata block
-        import json
-        json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
-        if json_match:
-            try:
-                metadata = json.loads(json_match.group(1))
-            except json.JSONDecodeError:
-                pass
+        json_match = _JSON_BLOCK_RE.search(content)
+        if not json_match:
+            return {}
         
-        return metadata
+        raw = json_match.group(1)
+        try:
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except ValueError:  # Both decoders raise ValueError subclasses
+            return {}
     
     def get_index_stats(self, collection_name: str = "terminology") -> Dict[str, Any]:
         """Get statistics about the terminology index."""
@@ -319,20 +537,39 @@ class TerminologyIndexer:
         total_files = 0
         total_size = 0
         term_types = set()
+        # Types come from the token index when it is loaded; stats never
+        # trigger a load or rebuild of it
+        local_index = self._local_indexes.get(collection_name)
+        file_types = local_index.file_types if local_index is not None else {}
         
-        for file_path in collection_dir.rglob("term_*.md"):
-            if file_path.is_file():
-                total_files += 1
-                total_size += file_path.stat().st_size
-                
-                # Extract term type from content
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-                    type_match = re.search(r'"term_type": "([^"]+)"', content)
-                    if type_match:
-                        term_types.add(type_match.group(1))
-                except Exception:
-                    pass
+        # Walk with scandir: directory entries already say what is a file,
+        # and term types come from the local index instead of file contents
+        pending = [(str(collection_dir), "")]
+        while pending:
+            dir_path, rel_dir = pending.pop()
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        rel_path = os.path.join(rel_dir, entry.name)
+                        if entry.is_dir():
+                            pending.append((entry.path, rel_path))
+                            continue
+                        if not (entry.name.startswith("term_") and entry.name.endswith(".md")):
+                            continue
+                        if not entry.is_file():
+                            continue
+                        
+                        total_files += 1
+                        total_size += entry.stat().st_size
+                        
+                        if rel_path in file_types:
+                            term_type = file_types[rel_path]
+                        else:
+                            term_type = self._read_term_type(entry.path)
+                        if term_type:
+                            term_types.add(term_type)
+            except OSError as exc:
+                LOGGER.warning("Error scanning %s: %s", dir_path, exc)
         
         return {
             "exists": True,
@@ -343,6 +580,16 @@ class TerminologyIndexer:
             "term_types": list(term_types),
         }
     
+    @staticmethod
+    def _read_term_type(path: str) -> Optional[str]:
+        """Read a term file's type from its metadata block."""
+        try:
+            with open(path, encoding="utf-8") as handle:
+                type_match = _TERM_TYPE_RE.search(handle.read())
+        except Exception:
+            return None
+        return type_match.group(1) if type_match else None
+    
     async def delete_collection(self, collection_name: str) -> bool:
         """Delete a terminology collection."""
         collection_dir = self._index_dir / collection_name
@@ -352,6 +599,8 @@ class TerminologyIndexer:
         try:
             import shutil
             shutil.rmtree(collection_dir)
+            self._local_indexes.pop(collection_name, None)
+            self._dirty_indexes.discard(collection_name)
             LOGGER.info("Deleted terminology collection '%s'", collection_name)
             return True
         except Exception as exc:
@@ -2,20 +2,113 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import json
 import logging
+import operator
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
 
 try:  # Optional dependency for AI-powered selection
     from openai import OpenAI
 except ImportError:  # pragma: no cover - optional runtime dependency
     OpenAI = None  # type: ignore
 
+try:  # Optional dependency for faster JSON parsing
+    import orjson
+except ImportError:  # pragma: no cover - optional runtime dependency
+    orjson = None  # type: ignore
+
+from ..cache_manager import SemanticAnswerCache
 from ..settings import Config
-from .extractor import ExtractedTerm
+from .extractor import CHARS_PER_TOKEN, ExtractedTerm, TermType, _load_tokenizer
 
 LOGGER = logging.getLogger(__name__)
 
+# The scoring instructions are identical for every batch, so they form the
+# system message; only the query and terms vary. A static prefix is reused
+# by the provider's prompt cache instead of being billed for every batch.
+SCORE_SYSTEM_PROMPT = """You are a technical relevance scoring expert.
+
+Score the relevance of each numbered term to the user's query and briefly
+explain the score.
+
+Return a JSON array with one object per term in order. Each object has a
+"score" (0.0-1.0) and a "reason" string, where:
+- 1.0 = highly relevant to the query
+- 0.5 = somewhat relevant
+- 0.0 = not relevant
+
+Consider:
+- Semantic relevance to the query
+- Technical specificity
+- Likely user intent
+- Context appropriateness
+
+Keep reasons concise (1 sentence).
+
+Example response: [
+    {"score": 0.9, "reason": "Direct match for the query term"},
+    {"score": 0.3, "reason": "Related concept from a different area"}
+]"""
+SCORE_PROMPT_TEMPLATE = """Query: "{query}"
+
+Terms to evaluate:
+{terms}
+"""
+
+# Most terms packed into one scoring request, whatever the token budget
+AI_SCORE_MAX_BATCH = 50
+DEFAULT_AI_REASON = "Selected by relevance scoring"
+
+REASON_SYSTEM_PROMPT = "You are a technical relevance explanation expert."
+REASON_PROMPT_TEMPLATE = """
+For each selected term, provide a brief reason why it was chosen for the query: "{query}"
+
+Selected terms:
+{terms}
+
+Return a JSON array of strings, each explaining why the corresponding term was selected.
+Keep explanations concise (1-2 sentences).
+
+Example response: [
+    "Direct match for the query term",
+    "Highly relevant technical concept in this domain",
+    "Frequently used function related to the query"
+]
+"""
+
+SIMILAR_SYSTEM_PROMPT = "You are a technical similarity expert."
+SIMILAR_PROMPT_TEMPLATE = """
+Find terms most similar to: "{term}" - {definition}
+
+Candidate terms:
+{candidates}
+
+Return a JSON array of indices (0-based) for the {limit} most similar terms.
+Consider semantic similarity, technical domain, and functional relationships.
+
+Example response: [2, 5, 1, 8, 0]
+"""
+
+
+def _loads(raw: str) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+# Heuristic relevance boost per term type, indexed by TermType value
+_TYPE_BOOST = np.zeros(max(t.value for t in TermType) + 1)
+for _term_type, _boost in (
+    (TermType.FUNCTION_NAME, 0.2),
+    (TermType.CLASS_NAME, 0.2),
+    (TermType.TECHNICAL_TERM, 0.15),
+    (TermType.ACRONYM, 0.1),
+    (TermType.CONCEPT, 0.05),
+):
+    _TYPE_BOOST[_term_type.value] = _boost
+
 
 @dataclass
 class SelectionCriteria:
@@ -42,10 +135,24 @@ class SelectedTerm:
 class TermSelector:
     """AI agent for intelligent term selection and shortlisting."""
     
-    def __init__(self, config: Config) -> None:
+    def __init__(
+        self,
+        config: Config,
+        *,
+        embed_query: Optional[Callable[[str], Any]] = None,
+    ) -> None:
         self.config = config
         self.settings = config.terminology
         self._llm_client = self._init_llm_client()
+        # Bounds LLM requests in flight across concurrent scoring batches
+        self._llm_semaphore = asyncio.Semaphore(max(1, self.settings.ai_concurrency))
+        self._tokenizer = _load_tokenizer(config.ai.model) if self._llm_client else None
+        # LLM scores and reasons are reused for near-identical queries over
+        # exactly the same terms; needs a query embedder to be enabled
+        self._embed_query = embed_query
+        self._ai_cache = SemanticAnswerCache(
+            config, similarity_threshold=0.95, overlap_threshold=1.0
+        )
     
     def _init_llm_client(self):  # pragma: no cover - runtime integration
         """Initialize OpenAI client for AI-powered selection."""
@@ -59,6 +166,25 @@ class TermSelector:
             LOGGER.warning("Failed to initialize OpenAI client: %s", exc)
             return None
     
+    def _query_embedding(self, query: str) -> Optional[Any]:
+        """Embed the query for the AI response cache, or None if unavailable."""
+        if self._embed_query is None:
+            return None
+        try:
+            return self._embed_query(query)
+        except Exception as exc:
+            LOGGER.debug("Query embedding failed; skipping AI cache: %s", exc)
+            return None
+    
+    @staticmethod
+    def _term_key(term: ExtractedTerm) -> str:
+        return f"{term.type_name}:{term.term}"
+    
+    async def _complete(self, **request: Any) -> Any:
+        """Run a chat completion off the event loop within the concurrency limit."""
+        async with self._llm_semaphore:
+            return await asyncio.to_thread(self._llm_client.chat.completions.create, **request)
+    
     async def select_terms(
         self,
         terms: List[ExtractedTerm],
@@ -77,8 +203,10 @@ class TermSelector:
         if not filtered_terms:
             return []
         
-        # Score terms for relevance
-        scored_terms = await self._score_terms(filtered_terms, query)
+        # Score terms for relevance; AI scoring also explains each score,
+        # keyed by _term_key, so selected terms need no second request
+        reasons: Dict[str, str] = {}
+        scored_terms = await self._score_terms(filtered_terms, query, reasons)
         
         # Apply diversity filtering
         diverse_terms = self._ensure_diversity(scored_terms, criteria)
@@ -87,7 +215,7 @@ class TermSelector:
         ranked_terms = self._rank_terms(diverse_terms, criteria)
         
         # Generate selection reasons
-        selected_terms = await self._generate_selection_reasons(ranked_terms, query)
+        selected_terms = await self._generate_selection_reasons(ranked_terms, query, reasons)
         
         LOGGER.debug(
             "Selected %d terms from %d candidates for query: %s",
@@ -115,80 +243,124 @@ class TermSelector:
         
         return filtered
     
-    async def _score_terms(self, terms: List[ExtractedTerm], query: str) -> List[tuple[ExtractedTerm, float]]:
+    async def _score_terms(
+        self,
+        terms: List[ExtractedTerm],
+        query: str,
+        reasons: Optional[Dict[str, str]] = None
+    ) -> List[tuple[ExtractedTerm, float]]:
         """Score terms based on relevance to the query."""
         if self._llm_client:
-            return await self._ai_score_terms(terms, query)
+            return await self._ai_score_terms(terms, query, reasons)
         else:
             return self._heuristic_score_terms(terms, query)
     
-    async def _ai_score_terms(self, terms: List[ExtractedTerm], query: str) -> List[tuple[ExtractedTerm, float]]:
-        """Use AI to score term relevance."""
-        # Limit terms to avoid token limits
-        scored_terms = []
-        batch_size = 10
-        
-        for i in range(0, len(terms), batch_size):
-            batch = terms[i:i + batch_size]
-            batch_scores = await self._score_batch_with_ai(batch, query)
-            scored_terms.extend(batch_scores)
-        
-        return scored_terms
+    async def _ai_score_terms(
+        self,
+        terms: List[ExtractedTerm],
+        query: str,
+        reasons: Optional[Dict[str, str]] = None
+    ) -> List[tuple[ExtractedTerm, float]]:
+        """Use AI to score term relevance, collecting its reasons into ``reasons``."""
+        # Batches are scored concurrently and each falls back to heuristics on
+        # its own if its request fails
+        batches = self._pack_score_batches(terms)
+        
+        batch_scores = await asyncio.gather(
+            *(self._score_batch_with_ai(batch, query, reasons) for batch in batches)
+        )
+        return [scored for batch in batch_scores for scored in batch]
+    
+    @staticmethod
+    def _describe_for_scoring(term: ExtractedTerm) -> str:
+        return (
+            f"Term: {term.term}\n"
+            f"Type: {term.type_name}\n"
+            f"Definition: {term.definition}\n"
+            f"Context: {term.context[:200]}...\n"
+        )
+    
+    def _count_tokens(self, text: str) -> int:
+        if self._tokenizer is None:
+            return len(text) // CHARS_PER_TOKEN + 1
+        return len(self._tokenizer.encode(text, disallowed_special=()))
+    
+    def _pack_score_batches(self, terms: List[ExtractedTerm]) -> List[List[ExtractedTerm]]:
+        """Greedily fill scoring batches up to the prompt token budget."""
+        budget = self.settings.ai_scoring_prompt_tokens
+        batches: List[List[ExtractedTerm]] = []
+        batch: List[ExtractedTerm] = []
+        used = 0
+        for term in terms:
+            cost = self._count_tokens(self._describe_for_scoring(term))
+            if batch and (used + cost > budget or len(batch) >= AI_SCORE_MAX_BATCH):
+                batches.append(batch)
+                batch, used = [], 0
+            batch.append(term)
+            used += cost
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    @staticmethod
+    def _parse_scored(item: Any) -> tuple[float, Optional[str]]:
+        """Read one ``{"score", "reason"}`` entry; a bare number carries no reason."""
+        if isinstance(item, dict):
+            reason = item.get("reason")
+            return float(item.get("score", 0.5)), reason if isinstance(reason, str) else None
+        return float(item), None
     
-    async def _score_batch_with_ai(self, terms: List[ExtractedTerm], query: str) -> List[tuple[ExtractedTerm, float]]:
+    async def _score_batch_with_ai(
+        self,
+        terms: List[ExtractedTerm],
+        query: str,
+        reasons: Optional[Dict[str, str]] = None
+    ) -> List[tuple[ExtractedTerm, float]]:
         """Score a batch of terms using AI."""
         if not self._llm_client:
             return self._heuristic_score_terms(terms, query)
         
-        # Prepare term descriptions for AI
-        term_descriptions = []
-        for term in terms:
-            desc = f"Term: {term.term}\n"
-            desc += f"Type: {term.term_type.name}\n"
-            desc += f"Definition: {term.definition}\n"
-            desc += f"Context: {term.context[:200]}...\n"
-            term_descriptions.append(desc)
-        
-        prompt = f"""
-        Score the relevance of each term to the query: "{query}"
+        keys = [self._term_key(term) for term in terms]
+        embedding = self._query_embedding(query)
+        if embedding is not None:
+            cached = self._ai_cache.get("score", embedding, keys)
+            if cached is not None:
+                if reasons is not None:
+                    reasons.update((key, cached[key][1]) for key in keys if cached[key][1])
+                return [(term, cached[key][0]) for term, key in zip(terms, keys)]
         
-        Terms to evaluate:
-        {chr(10).join(f"{i+1}. {desc}" for i, desc in enumerate(term_descriptions))}
-        
-        Return a JSON array of scores (0.0-1.0) where:
-        - 1.0 = highly relevant to the query
-        - 0.5 = somewhat relevant
-        - 0.0 = not relevant
-        
-        Consider:
-        - Semantic relevance to the query
-        - Technical specificity
-        - Likely user intent
-        - Context appropriateness
+        # Prepare term descriptions for AI
+        term_descriptions = [self._describe_for_scoring(term) for term in terms]
         
-        Example response: [0.9, 0.3, 0.8, 0.1]
-        """
+        prompt = SCORE_PROMPT_TEMPLATE.format(
+            query=query,
+            terms="\n".join(f"{i+1}. {desc}" for i, desc in enumerate(term_descriptions)),
+        )
         
         try:
-            response = self._llm_client.chat.completions.create(
+            response = await self._complete(
                 model=self.config.ai.model,
                 temperature=0.1,
-                max_tokens=500,
+                # Room for a score and a one-sentence reason per term
+                max_tokens=max(800, 40 * len(terms)),
                 messages=[
-                    {"role": "system", "content": "You are a technical relevance scoring expert."},
+                    {"role": "system", "content": SCORE_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ]
             )
             
-            import json
-            scores = json.loads(response.choices[0].message.content)
+            scored = [self._parse_scored(item) for item in _loads(response.choices[0].message.content)]
             
             # Ensure we have the right number of scores
-            if len(scores) != len(terms):
-                LOGGER.warning("AI returned %d scores for %d terms", len(scores), len(terms))
-                scores = scores[:len(terms)] + [0.5] * max(0, len(terms) - len(scores))
+            if len(scored) != len(terms):
+                LOGGER.warning("AI returned %d scores for %d terms", len(scored), len(terms))
+                scored = scored[:len(terms)] + [(0.5, None)] * max(0, len(terms) - len(scored))
             
-            return list(zip(terms, scores))
+            if embedding is not None:
+                self._ai_cache.set("score", embedding, keys, dict(zip(keys, scored)))
+            if reasons is not None:
+                reasons.update((key, reason) for key, (_, reason) in zip(keys, scored) if reason)
+            return [(term, score) for term, (score, _) in zip(terms, scored)]
             
         except Exception as exc:
             LOGGER.warning("AI scoring failed: %s", exc)
@@ -196,57 +368,49 @@ class TermSelector:
     
     def _heuristic_score_terms(self, terms: List[ExtractedTerm], query: str) -> List[tuple[ExtractedTerm, float]]:
         """Score terms using heuristics."""
+        if not terms:
+            return []
+        
         query_lower = query.lower()
         query_terms = query_lower.split()
-        
-        scored_terms = []
-        for term in terms:
-            score = 0.0
-            
-            # Exact term match
-            if term.term.lower() == query_lower:
-                score += 1.0
-            
-            # Partial term match
-            elif query_lower in term.term.lower() or term.term.lower() in query_lower:
-                score += 0.8
-            
-            # Query term matches in term name
+        count = len(terms)
+        
+        # Score every term at once from per-field arrays; each step adds or
+        # multiplies in the same order as scoring one term at a time would
+        names = np.array([term.term_lower for term in terms], dtype=str)
+        definitions = np.array([term.definition.lower() for term in terms], dtype=str)
+        contexts = np.array([term.context.lower() for term in terms], dtype=str)
+        
+        scores = np.zeros(count)
+        
+        # Exact term match, else partial term match
+        exact = names == query_lower
+        partial = (np.char.find(names, query_lower) >= 0) | (np.char.find(query_lower, names) >= 0)
+        scores += np.where(exact, 1.0, np.where(partial, 0.8, 0.0))
+        
+        # Query term matches in term name, definition and context; each
+        # distinct word is searched once per field, repeats reuse the result
+        distinct_terms = list(dict.fromkeys(query_terms))
+        for field_values, weight in ((names, 0.4), (definitions, 0.2), (contexts, 0.1)):
+            increments = {
+                q_term: np.where(np.char.find(field_values, q_term) >= 0, weight, 0.0)
+                for q_term in distinct_terms
+            }
             for q_term in query_terms:
-                if q_term in term.term.lower():
-                    score += 0.4
-            
-            # Query term matches in definition
-            if term.definition:
-                for q_term in query_terms:
-                    if q_term in term.definition.lower():
-                        score += 0.2
-            
-            # Query term matches in context
-            if term.context:
-                for q_term in query_terms:
-                    if q_term in term.context.lower():
-                        score += 0.1
-            
-            # Boost by confidence
-            score *= term.confidence
-            
-            # Boost by frequency
-            score *= (1 + min(term.frequency * 0.1, 0.5))
-            
-            # Boost by term type
-            type_boost = {
-                "FUNCTION_NAME": 0.2,
-                "CLASS_NAME": 0.2,
-                "TECHNICAL_TERM": 0.15,
-                "ACRONYM": 0.1,
-                "CONCEPT": 0.05,
-            }.get(term.term_type.name, 0.0)
-            score += type_boost
-            
-            scored_terms.append((term, min(score, 1.0)))
+                scores += increments[q_term]
+        
+        # Boost by confidence
+        scores *= np.fromiter((term.confidence for term in terms), dtype=np.float64, count=count)
+        
+        # Boost by frequency
+        frequency = np.fromiter((term.frequency for term in terms), dtype=np.float64, count=count)
+        scores *= 1 + np.minimum(frequency * 0.1, 0.5)
+        
+        # Boost by term type
+        type_code = np.fromiter((term.term_type.value for term in terms), dtype=np.intp, count=count)
+        scores += _TYPE_BOOST[type_code]
         
-        return scored_terms
+        return list(zip(terms, np.minimum(scores, 1.0).tolist()))
     
     def _ensure_diversity(
         self,
@@ -257,31 +421,37 @@ class TermSelector:
         if len(scored_terms) <= criteria.max_results:
             return scored_terms
         
-        # Sort by score
-        scored_terms.sort(key=lambda x: x[1], reverse=True)
+        # Take terms in descending score order lazily: usually only a little
+        # more than max_results are needed. Ties keep their input order.
+        heap = [(-score, index) for index, (_, score) in enumerate(scored_terms)]
+        heapq.heapify(heap)
         
         # Simple diversity: avoid selecting too many terms of the same type
         diverse_terms = []
+        skipped = []
         type_counts = {}
+        max_per_type = max(1, criteria.max_results // 3)  # Max 1/3 of results per type
         
-        for term, score in scored_terms:
-            term_type = term.term_type.name
+        while heap and len(diverse_terms) < criteria.max_results:
+            pair = scored_terms[heapq.heappop(heap)[1]]
+            term_type = pair[0].type_name
             
             # Check type diversity
-            max_per_type = max(1, criteria.max_results // 3)  # Max 1/3 of results per type
             if type_counts.get(term_type, 0) >= max_per_type:
+                skipped.append(pair)
                 continue
             
-            diverse_terms.append((term, score))
+            diverse_terms.append(pair)
             type_counts[term_type] = type_counts.get(term_type, 0) + 1
-            
-            if len(diverse_terms) >= criteria.max_results:
-                break
         
-        # If we didn't get enough diverse terms, fill with top remaining
-        if len(diverse_terms) < criteria.max_results:
-            remaining = [t for t in scored_terms if t not in diverse_terms]
-            diverse_terms.extend(remaining[:criteria.max_results - len(diverse_terms)])
+        # If we didn't get enough diverse terms, fill with top remaining:
+        # skipped terms all outrank the ones still in the heap
+        missing = criteria.max_results - len(diverse_terms)
+        if missing > 0:
+            fill = skipped[:missing]
+            while heap and len(fill) < missing:
+                fill.append(scored_terms[heapq.heappop(heap)[1]])
+            diverse_terms.extend(fill)
         
         return diverse_terms
     
@@ -291,21 +461,32 @@ class TermSelector:
         criteria: SelectionCriteria
     ) -> List[tuple[ExtractedTerm, float]]:
         """Rank terms and apply final limits."""
-        # Sort by score (descending)
-        scored_terms.sort(key=lambda x: x[1], reverse=True)
-        
-        # Apply limit
-        return scored_terms[:criteria.max_results]
+        # Top scores only, in descending order (stable for ties)
+        return heapq.nlargest(criteria.max_results, scored_terms, key=operator.itemgetter(1))
     
     async def _generate_selection_reasons(
         self,
         ranked_terms: List[tuple[ExtractedTerm, float]],
-        query: str
+        query: str,
+        reasons: Optional[Dict[str, str]] = None
     ) -> List[SelectedTerm]:
         """Generate human-readable reasons for term selection."""
         selected_terms = []
         
-        if self._llm_client:
+        keys = [self._term_key(term) for term, _ in ranked_terms]
+        if self._llm_client and reasons and all(key in reasons for key in keys):
+            # Reasons came back with the scores; no separate request needed
+            selected_terms = [
+                SelectedTerm(
+                    term=term,
+                    relevance_score=score,
+                    selection_reason=reasons[key],
+                    rank=i + 1,
+                    metadata={"selection_method": "ai"}
+                )
+                for i, ((term, score), key) in enumerate(zip(ranked_terms, keys))
+            ]
+        elif self._llm_client:
             selected_terms = await self._generate_ai_reasons(ranked_terms, query)
         else:
             selected_terms = self._generate_heuristic_reasons(ranked_terms, query)
@@ -321,52 +502,55 @@ class TermSelector:
         if not self._llm_client:
             return self._generate_heuristic_reasons(ranked_terms, query)
         
+        keys = [self._term_key(term) for term, _ in ranked_terms]
+        embedding = self._query_embedding(query)
+        cached = self._ai_cache.get("reason", embedding, keys) if embedding is not None else None
+        if cached is not None:
+            return [
+                SelectedTerm(
+                    term=term,
+                    relevance_score=score,
+                    selection_reason=cached[key],
+                    rank=i + 1,
+                    metadata={"selection_method": "ai"}
+                )
+                for i, ((term, score), key) in enumerate(zip(ranked_terms, keys))
+            ]
+        
         # Prepare for AI analysis
         term_summaries = []
         for i, (term, score) in enumerate(ranked_terms):
-            summary = f"{i+1}. {term.term} (score: {score:.2f}) - {term.term_type.name}"
+            summary = f"{i+1}. {term.term} (score: {score:.2f}) - {term.type_name}"
             term_summaries.append(summary)
         
-        prompt = f"""
-        For each selected term, provide a brief reason why it was chosen for the query: "{query}"
-        
-        Selected terms:
-        {chr(10).join(term_summaries)}
-        
-        Return a JSON array of strings, each explaining why the corresponding term was selected.
-        Keep explanations concise (1-2 sentences).
-        
-        Example response: [
-            "Direct match for the query term",
-            "Highly relevant technical concept in this domain",
-            "Frequently used function related to the query"
-        ]
-        """
+        prompt = REASON_PROMPT_TEMPLATE.format(query=query, terms="\n".join(term_summaries))
         
         try:
-            response = self._llm_client.chat.completions.create(
+            response = await self._complete(
                 model=self.config.ai.model,
                 temperature=0.3,
                 max_tokens=800,
                 messages=[
-                    {"role": "system", "content": "You are a technical relevance explanation expert."},
+                    {"role": "system", "content": REASON_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ]
             )
             
-            import json
-            reasons = json.loads(response.choices[0].message.content)
+            reasons = _loads(response.choices[0].message.content)
             
             # Ensure we have the right number of reasons
             if len(reasons) != len(ranked_terms):
-                reasons = reasons[:len(ranked_terms)] + ["Selected by relevance scoring"] * max(0, len(ranked_terms) - len(reasons))
+                reasons = reasons[:len(ranked_terms)] + [DEFAULT_AI_REASON] * max(0, len(ranked_terms) - len(reasons))
+            
+            if embedding is not None:
+                self._ai_cache.set("reason", embedding, keys, dict(zip(keys, reasons)))
             
             selected_terms = []
             for i, (term, score) in enumerate(ranked_terms):
                 selected_terms.append(SelectedTerm(
                     term=term,
                     relevance_score=score,
-                    selection_reason=reasons[i] if i < len(reasons) else "Selected by relevance scoring",
+                    selection_reason=reasons[i] if i < len(reasons) else DEFAULT_AI_REASON,
                     rank=i + 1,
                     metadata={"selection_method": "ai"}
                 ))
@@ -390,11 +574,11 @@ class TermSelector:
             reason_parts = []
             
             # Exact match
-            if term.term.lower() == query_lower:
+            if term.term_lower == query_lower:
                 reason_parts.append("Exact match for query")
             
             # Partial match
-            elif query_lower in term.term.lower():
+            elif query_lower in term.term_lower:
                 reason_parts.append("Contains query term")
             
             # High confidence
@@ -406,13 +590,13 @@ class TermSelector:
                 reason_parts.append("Frequently occurring term")
             
             # Type-specific reasons
-            if term.term_type.name == "FUNCTION_NAME":
+            if term.type_name == "FUNCTION_NAME":
                 reason_parts.append("Function definition")
-            elif term.term_type.name == "CLASS_NAME":
+            elif term.type_name == "CLASS_NAME":
                 reason_parts.append("Class definition")
-            elif term.term_type.name == "ACRONYM":
+            elif term.type_name == "ACRONYM":
                 reason_parts.append("Technical acronym")
-            elif term.term_type.name == "CONCEPT":
+            elif term.type_name == "CONCEPT":
                 reason_parts.append("Key concept")
             
             # Default reason
@@ -462,34 +646,28 @@ class TermSelector:
         candidate_descriptions = []
         
         for term in candidates:
-            desc = f"{term.term} ({term.term_type.name}): {term.definition}"
+            desc = f"{term.term} ({term.type_name}): {term.definition}"
             candidate_descriptions.append(desc)
         
-        prompt = f"""
-        Find terms most similar to: "{target_term.term}" - {target_term.definition}
-        
-        Candidate terms:
-        {chr(10).join(f"{i+1}. {desc}" for i, desc in enumerate(candidate_descriptions))}
-        
-        Return a JSON array of indices (0-based) for the {limit} most similar terms.
-        Consider semantic similarity, technical domain, and functional relationships.
-        
-        Example response: [2, 5, 1, 8, 0]
-        """
+        prompt = SIMILAR_PROMPT_TEMPLATE.format(
+            term=target_term.term,
+            definition=target_term.definition,
+            candidates="\n".join(f"{i+1}. {desc}" for i, desc in enumerate(candidate_descriptions)),
+            limit=limit,
+        )
         
         try:
-            response = self._llm_client.chat.completions.create(
+            response = await self._complete(
                 model=self.config.ai.model,
                 temperature=0.1,
                 max_tokens=200,
                 messages=[
-                    {"role": "system", "content": "You are a technical similarity expert."},
+                    {"role": "system", "content": SIMILAR_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ]
             )
             
-            import json
-            indices = json.loads(response.choices[0].message.content)
+            indices = _loads(response.choices[0].message.content)
             
             similar_terms = []
             for idx in indices[:limit]:
@@ -510,40 +688,46 @@ class TermSelector:
     ) -> List[ExtractedTerm]:
         """Find similar terms using heuristics."""
         candidates = [t for t in all_terms if t.term != target_term.term]
+        if not candidates:
+            return []
         
-        scored_candidates = []
-        target_lower = target_term.term.lower()
-        target_words = set(target_lower.split())
+        count = len(candidates)
+        target_lower = target_term.term_lower
+        target_words = target_term.word_set
+        candidate_lower = np.array([c.term_lower for c in candidates], dtype=str)
         
-        for candidate in candidates:
-            score = 0.0
-            candidate_lower = candidate.term.lower()
-            candidate_words = set(candidate_lower.split())
-            
-            # Word overlap
-            word_overlap = len(target_words & candidate_words)
-            if word_overlap > 0:
-                score += word_overlap * 0.3
-            
-            # Same type
-            if candidate.term_type == target_term.term_type:
-                score += 0.2
-            
-            # Similar length (indicates similar complexity)
-            length_diff = abs(len(target_lower) - len(candidate_lower))
-            if length_diff <= 3:
-                score += 0.1
-            
-            # Same source URL (contextual similarity)
-            if candidate.source_url == target_term.source_url:
-                score += 0.1
-            
-            # Substring similarity
-            if target_lower in candidate_lower or candidate_lower in target_lower:
-                score += 0.2
-            
-            scored_candidates.append((candidate, score))
+        scores = np.zeros(count)
+        
+        # Word overlap
+        word_overlap = np.fromiter(
+            (len(target_words & c.word_set) for c in candidates),
+            dtype=np.float64,
+            count=count,
+        )
+        scores += word_overlap * 0.3
+        
+        # Same type
+        same_type = np.fromiter(
+            (c.term_type == target_term.term_type for c in candidates), dtype=bool, count=count
+        )
+        scores += np.where(same_type, 0.2, 0.0)
+        
+        # Similar length (indicates similar complexity)
+        length_diff = np.abs(np.char.str_len(candidate_lower) - len(target_lower))
+        scores += np.where(length_diff <= 3, 0.1, 0.0)
+        
+        # Same source URL (contextual similarity)
+        same_source = np.fromiter(
+            (c.source_url == target_term.source_url for c in candidates), dtype=bool, count=count
+        )
+        scores += np.where(same_source, 0.1, 0.0)
+        
+        # Substring similarity
+        substring = (np.char.find(candidate_lower, target_lower) >= 0) | (
+            np.char.find(target_lower, candidate_lower) >= 0
+        )
+        scores += np.where(substring, 0.2, 0.0)
         
-        # Sort by score and return top results
-        scored_candidates.sort(key=lambda x: x[1], reverse=True)
-        return [term for term, _ in scored_candidates[:limit]]
+        # Stable descending order, as sorting the (term, score) pairs would give
+        order = np.argsort(-scores, kind="stable")[:limit]
+        return [candidates[i] for i in order]
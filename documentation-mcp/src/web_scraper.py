@@ -3,21 +3,41 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-from urllib.parse import urljoin, urlparse
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, TypeVar
+from urllib.parse import urljoin
 
 import aiohttp
 from aiohttp import ClientError, ClientSession
 from bs4 import BeautifulSoup
-from markdownify import markdownify
+from markdownify import MarkdownConverter
 from readability import Document
 
+from .cache_manager import HttpResponseCache
 from .settings import Config
 
 LOGGER = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Start method for CPU worker processes. This process runs asyncio worker
+# threads and model threads, so forking it could leave children holding
+# locks that some other thread owned; start workers from a clean process.
+WORKER_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Converts an already parsed summary to Markdown, so the HTML is not re-parsed.
+# markdownify renders <pre> as ``` fences, which the terminology extractor and
+# point analyzer match on; html2text would indent code blocks instead.
+_MARKDOWN_CONVERTER = MarkdownConverter(heading_style="ATX")
+
 
 @dataclass
 class ScrapedPage:
@@ -30,6 +50,31 @@ class ScrapedPage:
     metadata: Dict[str, str] = field(default_factory=dict)
 
 
+def _parse_page(url: str, html: str) -> ScrapedPage:
+    """Extract the readable content of a page; runs in parsing workers."""
+    doc = Document(html)
+    summary_html = doc.summary() or html
+    title = doc.short_title() or url
+
+    # One parse of the summary feeds text, links and Markdown. markdownify
+    # only walks BeautifulSoup trees, so a separate selectolax parse for text
+    # and links would add a parse rather than replace this one.
+    soup = BeautifulSoup(summary_html, "lxml")
+    text = soup.get_text("\n")
+    links = WebScraper._extract_links(url, soup)
+    markdown = _MARKDOWN_CONVERTER.convert_soup(soup)
+
+    return ScrapedPage(
+        url=url,
+        title=title,
+        html=summary_html,
+        text=WebScraper._cleanup_text(text),
+        markdown=markdown,
+        links=links,
+        metadata={"source_title": title},
+    )
+
+
 class WebScraper:
     """Fetches and normalizes documentation pages."""
 
@@ -37,16 +82,44 @@ class WebScraper:
         self.config = config
         self._semaphore = asyncio.Semaphore(config.scraping.max_concurrent_requests)
         self._session: Optional[ClientSession] = None
+        # CPU worker pool, created on first use; readability/bs4/markdownify
+        # are CPU-bound, and the documentation loader shares this pool
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+        self._http_cache: Optional[HttpResponseCache] = None
+        self._http_cache_enabled = config.scraping.http_cache
 
     async def _get_session(self) -> ClientSession:
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=self.config.scraping.timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            # One pooled session is shared by every caller of this scraper
+            # (RAG, deep search, proactive indexing); keep idle connections
+            # alive long enough to be reused across consecutive tasks.
+            # Documentation pages mostly come from a few hosts: cap connections
+            # per host and cache DNS for the length of a crawl.
+            connector = aiohttp.TCPConnector(
+                limit=self.config.scraping.max_concurrent_requests * 2,
+                limit_per_host=self.config.scraping.max_connections_per_host,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            )
+            # aiohttp already advertises gzip/deflate (and br when Brotli is
+            # installed) and decompresses responses itself
+            self._session = aiohttp.ClientSession(
+                timeout=timeout,
+                connector=connector,
+                headers={"User-Agent": self.config.scraping.user_agent},
+            )
         return self._session
 
     async def close(self) -> None:
         if self._session and not self._session.closed:
             await self._session.close()
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+            self._cpu_pool = None
+        if self._http_cache is not None:
+            self._http_cache.close()
+            self._http_cache = None
 
     async def __aenter__(self) -> "WebScraper":
         await self._get_session()
@@ -55,16 +128,51 @@ class WebScraper:
     async def __aexit__(self, *exc_info) -> None:
         await self.close()
 
+    def _get_http_cache(self) -> Optional[HttpResponseCache]:
+        if self._http_cache is None and self._http_cache_enabled:
+            path = Path(self.config.cache.storage_path) / "http_cache.sqlite3"
+            try:
+                self._http_cache = HttpResponseCache(
+                    path,
+                    max_entries=self.config.scraping.http_cache_max_entries,
+                    max_age=self.config.scraping.http_cache_max_age,
+                )
+            except Exception as exc:
+                LOGGER.warning("HTTP response cache unavailable at %s: %s", path, exc)
+                self._http_cache_enabled = False
+        return self._http_cache
+
     async def fetch(self, url: str) -> Optional[str]:
         """Fetch raw HTML for a URL with throttling and retries."""
 
         async with self._semaphore:
-            session = await self._get_session()
-            headers = {"User-Agent": self.config.scraping.user_agent}
+            session = self._session
+            if session is None or session.closed:
+                # Only the first fetch (or one after close()) builds the session
+                session = await self._get_session()
+            http_cache = self._http_cache or self._get_http_cache()
+            cached = await asyncio.to_thread(http_cache.get, url) if http_cache else None
+            headers = {}
+            if cached is not None:
+                if cached.etag:
+                    headers["If-None-Match"] = cached.etag
+                if cached.last_modified:
+                    headers["If-Modified-Since"] = cached.last_modified
             try:
                 async with session.get(url, headers=headers) as response:
-                    response.raise_for_status()
-                    html = await response.text()
+                    if response.status == 304 and cached is not None:
+                        html = cached.body
+                        await asyncio.to_thread(http_cache.touch, url)
+                    else:
+                        response.raise_for_status()
+                        html = await response.text()
+                        etag = response.headers.get("ETag")
+                        last_modified = response.headers.get("Last-Modified")
+                        if http_cache is not None and (etag or last_modified):
+                            await asyncio.to_thread(http_cache.set, url, etag, last_modified, html)
+                        elif cached is not None:
+                            # The stored validators and body are now stale
+                            await asyncio.to_thread(http_cache.delete, url)
                     await asyncio.sleep(self.config.scraping.request_delay)
                     return html
             except ClientError as exc:
@@ -74,15 +182,17 @@ class WebScraper:
     @staticmethod
     def _extract_links(url: str, soup: BeautifulSoup) -> List[str]:
         links: List[str] = []
+        seen: Set[str] = set()  # Preserve order, remove duplicates
         for anchor in soup.find_all("a", href=True):
             href = anchor["href"].strip()
             if href.startswith("#"):
                 continue
             absolute = urljoin(url, href)
-            parsed = urlparse(absolute)
-            if parsed.scheme.startswith("http"):
+            # Prefix test instead of urlparse; the scheme may be upper-case
+            if absolute[:8].lower().startswith(("http://", "https://")) and absolute not in seen:
+                seen.add(absolute)
                 links.append(absolute)
-        return list(dict.fromkeys(links))  # Preserve order, remove duplicates
+        return links
 
     @staticmethod
     def _cleanup_text(text: str) -> str:
@@ -90,24 +200,29 @@ class WebScraper:
         return text.strip()
 
     def _parse(self, url: str, html: str) -> ScrapedPage:
-        doc = Document(html)
-        summary_html = doc.summary() or html
-        title = doc.short_title() or url
-
-        soup = BeautifulSoup(summary_html, "lxml")
-        text = soup.get_text("\n")
-        markdown = markdownify(summary_html, heading_style="ATX")
-        links = self._extract_links(url, soup)
-
-        return ScrapedPage(
-            url=url,
-            title=title,
-            html=summary_html,
-            text=self._cleanup_text(text),
-            markdown=markdown,
-            links=links,
-            metadata={"source_title": title},
-        )
+        return _parse_page(url, html)
+
+    async def run_in_worker(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a picklable CPU-bound function in the worker pool.
+
+        Falls back to a thread if the pool breaks.
+        """
+        if self._cpu_pool is None:
+            self._cpu_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=WORKER_MP_CONTEXT,
+            )
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._cpu_pool, func, *args)
+        except BrokenProcessPool:
+            LOGGER.warning("CPU worker pool broke, using a thread")
+            self._cpu_pool = None
+        return await asyncio.to_thread(func, *args)
+
+    async def _parse_off_loop(self, url: str, html: str) -> ScrapedPage:
+        """Parse a page in a worker process, falling back to a thread."""
+        return await self.run_in_worker(_parse_page, url, html)
 
     async def scrape(self, url: str) -> Optional[ScrapedPage]:
         """Fetch and normalize a documentation page."""
@@ -115,7 +230,7 @@ class WebScraper:
         html = await self.fetch(url)
         if not html:
             return None
-        return self._parse(url, html)
+        return await self._parse_off_loop(url, html)
 
     async def scrape_many(self, urls: List[str]) -> List[ScrapedPage]:
         tasks = [self.scrape(url) for url in urls]
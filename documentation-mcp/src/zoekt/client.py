@@ -4,12 +4,23 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import aiohttp
 from aiohttp import ClientError, ClientSession
 
+try:  # Optional dependency for faster JSON parsing
+    import orjson
+except ImportError:  # pragma: no cover - optional runtime dependency
+    orjson = None  # type: ignore
+
+try:  # Optional dependency for streaming large search responses
+    import ijson
+except ImportError:  # pragma: no cover - optional runtime dependency
+    ijson = None  # type: ignore
+
 from ..settings import Config
 
 LOGGER = logging.getLogger(__name__)
@@ -19,6 +30,13 @@ class ZoektError(Exception):
     """Raised when Zoekt API operations fail."""
 
 
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON response body, with orjson when it is installed."""
+    if orjson is None:
+        return await response.json()
+    return orjson.loads(await response.read())
+
+
 @dataclass
 class ZoektMatch:
     """A single match within a file."""
@@ -53,6 +71,10 @@ class ZoektClient:
         self.config = config
         self.settings = config.zoekt
         self._session: Optional[ClientSession] = None
+        # Parsed /api/list response and when it was fetched (monotonic)
+        self._repos_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        # Concurrent callers share one listing request
+        self._repos_task: Optional[asyncio.Task] = None
 
     @property
     def enabled(self) -> bool:
@@ -61,7 +83,14 @@ class ZoektClient:
     async def _get_session(self) -> ClientSession:
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=self.settings.timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            # Every request goes to the one Zoekt server; keep a bounded pool
+            # of idle connections open so searches skip the TCP handshake
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
         return self._session
 
     async def close(self) -> None:
@@ -131,8 +160,10 @@ class ZoektClient:
 
             async with session.get(url, params=params) as response:
                 response.raise_for_status()
-                data = await response.json()
-                return self._parse_results(data)
+                if ijson is None:
+                    data = await _read_json(response)
+                    return self._parse_results(data)
+                return await self._parse_results_stream(response.content, max_results)
 
         except ClientError as exc:
             LOGGER.error("Zoekt search failed: %s", exc)
@@ -143,65 +174,113 @@ class ZoektClient:
 
     def _parse_results(self, data: Dict[str, Any]) -> List[ZoektResult]:
         """Parse Zoekt JSON response into result objects."""
-        results: List[ZoektResult] = []
-
         file_matches = data.get("Result", {}).get("FileMatches") or []
+        return [self._parse_file_match(file_match) for file_match in file_matches]
 
-        for file_match in file_matches:
-            file_name = file_match.get("FileName", "")
-            repository = file_match.get("Repository", "")
-            language = file_match.get("Language", "")
-            score = float(file_match.get("Score", 0.0))
-
-            matches: List[ZoektMatch] = []
-            line_matches = file_match.get("LineMatches") or []
-
-            for line_match in line_matches:
-                line_number = line_match.get("LineNumber", 0)
-                line_content = line_match.get("Line", "")
-
-                # Handle context if provided
-                before = line_match.get("Before") or []
-                after = line_match.get("After") or []
-
-                matches.append(
-                    ZoektMatch(
-                        line_number=line_number,
-                        line_content=line_content,
-                        context_before=before,
-                        context_after=after,
-                    )
-                )
+    async def _parse_results_stream(
+        self,
+        stream: aiohttp.StreamReader,
+        max_results: int,
+    ) -> List[ZoektResult]:
+        """Parse file matches as the response body arrives.
 
-            results.append(
-                ZoektResult(
-                    file_name=file_name,
-                    repository=repository,
-                    language=language,
-                    matches=matches,
-                    score=score,
+        Only one file match is held as parsed JSON at a time, and reading
+        stops once ``max_results`` files have been collected.
+        """
+        results: List[ZoektResult] = []
+        async for file_match in ijson.items_async(stream, "Result.FileMatches.item"):
+            results.append(self._parse_file_match(file_match))
+            if len(results) >= max_results:
+                break
+        return results
+
+    @staticmethod
+    def _parse_file_match(file_match: Dict[str, Any]) -> ZoektResult:
+        """Build a ZoektResult from one entry of Result.FileMatches."""
+        file_name = file_match.get("FileName", "")
+        repository = file_match.get("Repository", "")
+        language = file_match.get("Language", "")
+        score = float(file_match.get("Score", 0.0))
+
+        matches: List[ZoektMatch] = []
+        line_matches = file_match.get("LineMatches") or []
+
+        for line_match in line_matches:
+            line_number = line_match.get("LineNumber", 0)
+            line_content = line_match.get("Line", "")
+
+            # Handle context if provided
+            before = line_match.get("Before") or []
+            after = line_match.get("After") or []
+
+            matches.append(
+                ZoektMatch(
+                    line_number=line_number,
+                    line_content=line_content,
+                    context_before=before,
+                    context_after=after,
                 )
             )
 
-        return results
+        return ZoektResult(
+            file_name=file_name,
+            repository=repository,
+            language=language,
+            matches=matches,
+            score=score,
+        )
 
     async def list_repos(self) -> List[Dict[str, Any]]:
-        """List all indexed repositories."""
+        """List all indexed repositories, reusing a recent listing."""
         if not self.enabled:
             return []
 
+        if self._repos_cache is not None:
+            fetched_at, repos = self._repos_cache
+            if time.monotonic() - fetched_at < self.settings.repos_cache_ttl:
+                return list(repos)
+
+        if self._repos_task is None:
+            self._repos_task = asyncio.create_task(self._fetch_repos())
+            self._repos_task.add_done_callback(self._finish_repos_fetch)
+        # Shield so one caller's cancellation does not cancel the others
+        repos = await asyncio.shield(self._repos_task)
+        return list(repos) if repos is not None else []
+
+    async def list_repos_batch(self, names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Resolve several repositories by name from one listing."""
+        wanted = set(names)
+        return {
+            repo["Name"]: repo
+            for repo in await self.list_repos()
+            if repo.get("Name") in wanted
+        }
+
+    def clear_repo_cache(self) -> None:
+        """Forget the cached listing, e.g. after new code has been indexed."""
+        self._repos_cache = None
+
+    def _finish_repos_fetch(self, task: asyncio.Task) -> None:
+        if self._repos_task is task:
+            self._repos_task = None
+
+    async def _fetch_repos(self) -> Optional[List[Dict[str, Any]]]:
+        """Fetch /api/list; failures return None and are not cached."""
         try:
             session = await self._get_session()
             url = f"{self.settings.server_url}/api/list"
 
             async with session.get(url) as response:
                 response.raise_for_status()
-                data = await response.json()
-                return data.get("Repos", [])
+                data = await _read_json(response)
+                repos = data.get("Repos") or []
 
         except ClientError as exc:
             LOGGER.warning("Failed to list Zoekt repos: %s", exc)
-            return []
+            return None
+
+        self._repos_cache = (time.monotonic(), repos)
+        return repos
 
     async def search_code(
         self,
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
 import logging
 import os
@@ -9,13 +11,70 @@ import re
 import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from ..settings import Config
 from ..web_scraper import ScrapedPage
 
 LOGGER = logging.getLogger(__name__)
 
+# Markdown code fence: ```lang\n...```
+_CODE_FENCE_RE = re.compile(r"```([a-zA-Z0-9_+-]*)\n([\s\S]*?)```")
+
+
+# File extension per code fence language; unknown languages become .txt
+_LANGUAGE_EXTENSIONS: Dict[str, str] = {
+    "python": ".py",
+    "py": ".py",
+    "javascript": ".js",
+    "js": ".js",
+    "typescript": ".ts",
+    "ts": ".ts",
+    "tsx": ".tsx",
+    "jsx": ".jsx",
+    "rust": ".rs",
+    "go": ".go",
+    "java": ".java",
+    "c": ".c",
+    "cpp": ".cpp",
+    "c++": ".cpp",
+    "csharp": ".cs",
+    "cs": ".cs",
+    "ruby": ".rb",
+    "php": ".php",
+    "swift": ".swift",
+    "kotlin": ".kt",
+    "scala": ".scala",
+    "html": ".html",
+    "css": ".css",
+    "scss": ".scss",
+    "json": ".json",
+    "yaml": ".yaml",
+    "yml": ".yaml",
+    "toml": ".toml",
+    "xml": ".xml",
+    "sql": ".sql",
+    "shell": ".sh",
+    "bash": ".sh",
+    "sh": ".sh",
+    "zsh": ".sh",
+    "fish": ".fish",
+    "powershell": ".ps1",
+    "dockerfile": ".dockerfile",
+    "makefile": ".makefile",
+    "markdown": ".md",
+    "md": ".md",
+    "text": ".txt",
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _url_hash(url: str) -> str:
+    """Directory name for a source URL's code block files."""
+    # Kept as a SHA-256 prefix so re-indexed pages overwrite their existing
+    # directory instead of leaving a stale copy for Zoekt to match
+    return hashlib.sha256(url.encode()).hexdigest()[:8]
+
 
 @dataclass
 class CodeBlock:
@@ -27,10 +86,11 @@ class CodeBlock:
     line_start: int = 0
     metadata: Dict[str, str] = field(default_factory=dict)
 
-    @property
+    @functools.cached_property
     def hash_id(self) -> str:
         """Generate a unique hash for this code block."""
-        content_hash = hashlib.sha256(self.content.encode()).hexdigest()[:12]
+        # Only an in-memory identity, never persisted, so any short digest works
+        content_hash = hashlib.blake2b(self.content.encode(), digest_size=6).hexdigest()
         return f"{content_hash}_{self.language}"
 
 
@@ -46,6 +106,12 @@ class ZoektIndexer:
         self.settings = config.zoekt
         self._index_dir = Path(self.settings.index_dir).expanduser().resolve()
         self._ensure_index_dir()
+        # Called after new code blocks are written, e.g. to drop search caches
+        self._index_listeners: List[Callable[[], None]] = []
+
+    def add_index_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback run whenever pages have been indexed."""
+        self._index_listeners.append(listener)
 
     def _ensure_index_dir(self) -> None:
         """Create index directory if it doesn't exist."""
@@ -57,12 +123,14 @@ class ZoektIndexer:
 
         Looks for markdown code fences (```lang...```) in the content.
         """
-        pattern = r"```([a-zA-Z0-9_+-]*)\n([\s\S]*?)```"
         blocks: List[CodeBlock] = []
 
         # Search in markdown content
         content = page.markdown or page.text
-        matches = re.finditer(pattern, content)
+        matches = _CODE_FENCE_RE.finditer(content)
+        # Matches come in order, so line numbers are counted incrementally
+        line_start = 1
+        counted_to = 0
 
         for idx, match in enumerate(matches):
             language = match.group(1).lower() or "text"
@@ -72,7 +140,8 @@ class ZoektIndexer:
                 continue
 
             # Estimate line number based on position in content
-            line_start = content[: match.start()].count("\n") + 1
+            line_start += content.count("\n", counted_to, match.start())
+            counted_to = match.start()
 
             blocks.append(
                 CodeBlock(
@@ -111,7 +180,7 @@ class ZoektIndexer:
         # Group blocks by source URL
         blocks_by_url: Dict[str, List[CodeBlock]] = {}
         for block in blocks:
-            url_hash = hashlib.sha256(block.source_url.encode()).hexdigest()[:8]
+            url_hash = _url_hash(block.source_url)
             if url_hash not in blocks_by_url:
                 blocks_by_url[url_hash] = []
             blocks_by_url[url_hash].append(block)
@@ -129,57 +198,14 @@ class ZoektIndexer:
                 header = self._build_metadata_header(block)
                 file_content = f"{header}\n{block.content}"
 
-                file_path.write_text(file_content, encoding="utf-8")
+                file_path.write_bytes(file_content.encode("utf-8"))
 
         return repo_dir
 
     @staticmethod
     def _language_to_extension(language: str) -> str:
         """Map language identifier to file extension."""
-        extensions = {
-            "python": ".py",
-            "py": ".py",
-            "javascript": ".js",
-            "js": ".js",
-            "typescript": ".ts",
-            "ts": ".ts",
-            "tsx": ".tsx",
-            "jsx": ".jsx",
-            "rust": ".rs",
-            "go": ".go",
-            "java": ".java",
-            "c": ".c",
-            "cpp": ".cpp",
-            "c++": ".cpp",
-            "csharp": ".cs",
-            "cs": ".cs",
-            "ruby": ".rb",
-            "php": ".php",
-            "swift": ".swift",
-            "kotlin": ".kt",
-            "scala": ".scala",
-            "html": ".html",
-            "css": ".css",
-            "scss": ".scss",
-            "json": ".json",
-            "yaml": ".yaml",
-            "yml": ".yaml",
-            "toml": ".toml",
-            "xml": ".xml",
-            "sql": ".sql",
-            "shell": ".sh",
-            "bash": ".sh",
-            "sh": ".sh",
-            "zsh": ".sh",
-            "fish": ".fish",
-            "powershell": ".ps1",
-            "dockerfile": ".dockerfile",
-            "makefile": ".makefile",
-            "markdown": ".md",
-            "md": ".md",
-            "text": ".txt",
-        }
-        return extensions.get(language.lower(), ".txt")
+        return _LANGUAGE_EXTENSIONS.get(language.lower(), ".txt")
 
     @staticmethod
     def _build_metadata_header(block: CodeBlock) -> str:
@@ -220,8 +246,11 @@ class ZoektIndexer:
                 "blocks_extracted": 0,
             }
 
-        # Prepare files for Zoekt
-        repo_path = self.prepare_for_indexing(all_blocks, repo_name)
+        # Prepare files for Zoekt; the writes run in one worker thread call
+        # so a large crawl does not block the event loop on disk I/O
+        repo_path = await asyncio.to_thread(self.prepare_for_indexing, all_blocks, repo_name)
+        for listener in self._index_listeners:
+            listener()
 
         LOGGER.info(
             "Prepared %d code blocks for indexing in %s",
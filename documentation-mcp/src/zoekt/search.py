@@ -2,18 +2,61 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..settings import Config
 from .client import ZoektClient, ZoektResult, ZoektMatch, ZoektError
 
 LOGGER = logging.getLogger(__name__)
 
-
-@dataclass
+_SearchKey = Tuple[str, Optional[str], Optional[int]]
+
+# Identifier-like tokens and the common keywords excluded from them
+_IDENT_RE = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]{2,})\b")
+_KEYWORDS = frozenset(
+    {
+        "def",
+        "class",
+        "import",
+        "from",
+        "return",
+        "if",
+        "else",
+        "for",
+        "while",
+        "try",
+        "except",
+        "with",
+        "as",
+        "in",
+        "not",
+        "and",
+        "or",
+        "True",
+        "False",
+        "None",
+        "self",
+        "function",
+        "const",
+        "let",
+        "var",
+        "async",
+        "await",
+        "export",
+        "default",
+        "this",
+        "new",
+    }
+)
+
+
+@dataclass(slots=True)
 class CodeSearchResult:
     """A unified code search result."""
 
@@ -27,6 +70,18 @@ class CodeSearchResult:
     source_url: Optional[str] = None
     metadata: Dict[str, str] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to the dictionary returned by the search tools."""
+        return {
+            "file_path": self.file_path,
+            "language": self.language,
+            "snippet": self.snippet,
+            "line_number": self.line_number,
+            "context": self.context,
+            "score": self.score,
+            "source_url": self.source_url,
+        }
+
 
 class ZoektSearchEngine:
     """High-level search interface combining Zoekt with metadata enrichment."""
@@ -34,6 +89,14 @@ class ZoektSearchEngine:
     def __init__(self, config: Config) -> None:
         self.config = config
         self.client = ZoektClient(config)
+        # Recent results by (query, language, max_results), oldest first
+        self._cache: OrderedDict[_SearchKey, Tuple[float, List[CodeSearchResult]]] = OrderedDict()
+        self._cache_ttl = config.zoekt.search_cache_ttl
+        self._cache_size = config.zoekt.search_cache_size
+        # Concurrent identical searches share one upstream request
+        self._inflight: Dict[_SearchKey, asyncio.Task] = {}
+        # Bumped by invalidate() so requests started before it are not cached
+        self._generation = 0
 
     @property
     def enabled(self) -> bool:
@@ -48,6 +111,20 @@ class ZoektSearchEngine:
     async def __aexit__(self, *exc_info) -> None:
         await self.close()
 
+    def invalidate(self) -> None:
+        """Drop cached results; called when new code blocks have been written.
+
+        The Zoekt server re-indexes those files on its own schedule, so a
+        search shortly after this can still cache pre-update results. Such
+        results live at most ``zoekt.search_cache_ttl`` seconds, which is
+        what bounds staleness; this only avoids serving results that were
+        cached before the new files existed.
+        """
+        self._cache.clear()
+        self._inflight.clear()
+        self._generation += 1
+        self.client.clear_repo_cache()
+
     def _extract_source_url(self, file_path: str, content: str) -> Optional[str]:
         """Extract source URL from metadata header in indexed file."""
         for line in content.split("\n")[:5]:
@@ -115,26 +192,59 @@ class ZoektSearchEngine:
         if not self.enabled:
             return []
 
-        try:
-            results = await self.client.search_code(
-                query,
-                language=language,
-                file_pattern=None,
-            )
-
-            code_results: List[CodeSearchResult] = []
-            for result in results:
-                code_results.extend(self._convert_result(result))
-
-            if max_results:
-                code_results = code_results[:max_results]
+        key = (query, language, max_results)
+        entry = self._cache.get(key)
+        if entry is not None:
+            if time.monotonic() - entry[0] < self._cache_ttl:
+                self._cache.move_to_end(key)
+                return list(entry[1])
+            del self._cache[key]
 
-            return code_results
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._search_uncached(key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_inflight(key, done))
 
+        try:
+            # Shield so one caller's cancellation does not cancel the others
+            return list(await asyncio.shield(task))
         except ZoektError as exc:
             LOGGER.warning("Zoekt search failed: %s", exc)
             return []
 
+    def _finish_inflight(self, key: _SearchKey, task: asyncio.Task) -> None:
+        # invalidate() may already have replaced the entry with a newer task
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark a failure as retrieved even if every waiter was cancelled, so
+        # asyncio does not log "Task exception was never retrieved"
+        if not task.cancelled():
+            task.exception()
+
+    async def _search_uncached(self, key: _SearchKey) -> List[CodeSearchResult]:
+        query, language, max_results = key
+        generation = self._generation
+        results = await self.client.search_code(
+            query,
+            language=language,
+            file_pattern=None,
+        )
+
+        code_results: List[CodeSearchResult] = []
+        for result in results:
+            code_results.extend(self._convert_result(result))
+
+        if max_results:
+            code_results = code_results[:max_results]
+
+        if self._cache_ttl > 0 and generation == self._generation:
+            self._cache[key] = (time.monotonic(), code_results)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        return code_results
+
     async def search_examples(
         self,
         query: str,
@@ -151,8 +261,9 @@ class ZoektSearchEngine:
         seen_snippets: set = set()
 
         for result in results:
-            # Deduplicate similar snippets
-            snippet_key = result.snippet.strip()[:100]
+            # Deduplicate similar snippets; whitespace is normalized so
+            # re-indented or re-wrapped copies of a line collapse together
+            snippet_key = " ".join(result.snippet.split())[:100]
             if snippet_key in seen_snippets:
                 continue
             seen_snippets.add(snippet_key)
@@ -182,43 +293,10 @@ class ZoektSearchEngine:
         Extracts key identifiers from the snippet and searches for them.
         """
         # Extract potential identifiers (function names, variables, etc.)
-        identifiers = re.findall(r"\b([a-zA-Z_][a-zA-Z0-9_]{2,})\b", code_snippet)
-
-        # Filter common keywords
-        keywords = {
-            "def",
-            "class",
-            "import",
-            "from",
-            "return",
-            "if",
-            "else",
-            "for",
-            "while",
-            "try",
-            "except",
-            "with",
-            "as",
-            "in",
-            "not",
-            "and",
-            "or",
-            "True",
-            "False",
-            "None",
-            "self",
-            "function",
-            "const",
-            "let",
-            "var",
-            "async",
-            "await",
-            "export",
-            "default",
-            "this",
-            "new",
-        }
-        identifiers = [i for i in identifiers if i not in keywords]
+        # once each, in order of first appearance, and drop common keywords
+        identifiers = [
+            i for i in dict.fromkeys(_IDENT_RE.findall(code_snippet)) if i not in _KEYWORDS
+        ]
 
         if not identifiers:
             return []
@@ -232,8 +310,10 @@ class ZoektSearchEngine:
         if not self.enabled:
             return {"enabled": False}
 
-        repos = await self.client.list_repos()
-        healthy = await self.client.health_check()
+        repos, healthy = await asyncio.gather(
+            self.client.list_repos(),
+            self.client.health_check(),
+        )
 
         return {
             "enabled": True,